@@ -4,6 +4,7 @@
 새로운 모듈 구조에 맞춘 import 경로 및 기능 개선
 """
 
+import os
 import sys
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
@@ -11,78 +12,59 @@ from datetime import datetime, timedelta
 from pathlib import Path
 import shutil
 import logging
+import importlib
 import re
-from typing import Dict, List, Optional
-import threading
+from typing import Dict, Iterable, List, Optional
 import queue
+import concurrent.futures
 
-# 프로젝트 루트를 Python 경로에 추가
+# 프로젝트 루트 (python -m applications.gui 로 실행하거나 PYTHONPATH에 포함)
 project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root))
 
-# 날짜 선택 기능을 위한 추가 import
-try:
-    from tkcalendar import DateEntry
-    TKCALENDAR_AVAILABLE = True
-except ImportError:
-    TKCALENDAR_AVAILABLE = False
-    print("⚠️ tkcalendar not available - using basic date selection")
+# 데이터 현황 확인 대상 경로
+TEMPLATE_FILE = project_root / "2025년도 주간보고 양식_2.xlsx"
+PROCESSED_DIR = project_root / "data/processed"
 
-import pandas as pd
+# import 진단 메시지는 DEBUG 로그로만 남김 (핸들러 미설정 시 출력 없음)
+logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
 
-# 리팩토링된 모듈들 import
-try:
-    print("통합 테스트: 리팩토링된 모듈 import 시도...")
-    
-    # 1. 유틸리티 모듈들
-    from modules.utils.config_manager import get_config
-    print("   ✓ config_manager import 성공")
-    
-    from modules.gui.login_dialog import get_erp_accounts
-    print("   ✓ login_dialog import 성공")
-    
-    # 2. 핵심 분석 모듈들
-    from modules.core.sales_calculator import main as analyze_sales
-    print("   ✓ sales_calculator import 성공")
-    
-    from modules.core.accounts_receivable_analyzer import main as analyze_receivables
-    print("   ✓ accounts_receivable_analyzer import 성공")
-    
-    # 3. 데이터 처리 모듈들
-    from modules.data.unified_data_collector import UnifiedDataCollector
-    print("   ✓ unified_data_collector import 성공")
-    
-    # 4. 보고서 생성 모듈들
-    try:
-        from modules.reports.xml_safe_report_generator import StandardFormatReportGenerator
-        WeeklyReportGenerator = StandardFormatReportGenerator
-        print("✅ StandardFormatReportGenerator 로드 성공")
-    except ImportError:
-        try:
-            from modules.reports.xml_safe_report_generator import XMLSafeReportGenerator
-            WeeklyReportGenerator = XMLSafeReportGenerator
-            print("✅ XML 안전 보고서 생성기 import 성공")
-        except ImportError:
-            WeeklyReportGenerator = None
-            print("⚠️ 보고서 생성기를 찾을 수 없습니다")
-        
-except ImportError as e:
-    print(f"필수 모듈 import 실패: {e}")
-    print("기존 모듈들로 fallback 시도...")
-    
-    # 기존 모듈들 fallback import
-    WeeklyReportGenerator = None
+# 시작 시 필요한 모듈 (모듈 경로, 속성 이름)
+# (pandas, 분석/수집/보고서 모듈은 무거우므로 실제 사용 시점에 지연 import)
+_REQUIRED = [
+    ("modules.utils.config_manager", "get_config"),
+    ("modules.gui.login_dialog", "get_erp_accounts"),
+]
+
+# 보고서 생성기 후보 - 앞에서부터 import 가능한 것을 사용
+_REPORT_GENERATOR_CANDIDATES = [
+    ("modules.reports.xml_safe_report_generator", "StandardFormatReportGenerator"),
+    ("modules.reports.xml_safe_report_generator", "XMLSafeReportGenerator"),
+]
+
+
+def _try_import(module_name: str, attr: str):
+    """모듈에서 속성을 import (실패 시 None)"""
     try:
-        from modules.utils.config_manager import get_config
-        from modules.gui.login_dialog import get_erp_accounts
-        from modules.core.sales_calculator import main as analyze_sales
-        from modules.core.accounts_receivable_analyzer import main as analyze_receivables
-        from modules.data.unified_data_collector import UnifiedDataCollector
-        print("✅ Fallback 모듈 import 성공")
-    except ImportError as fallback_error:
-        print(f"Fallback 모듈 import도 실패: {fallback_error}")
-        messagebox.showerror("오류", "필수 모듈을 찾을 수 없습니다. 프로그램을 종료합니다.")
-        sys.exit(1)
+        return getattr(importlib.import_module(module_name), attr)
+    except (ImportError, AttributeError) as e:
+        logger.debug(f"   ✗ {module_name}.{attr} import 실패: {e}")
+        return None
+
+
+_required = {}
+try:
+    for _module_name, _attr in _REQUIRED:
+        _required[_attr] = getattr(importlib.import_module(_module_name), _attr)
+        logger.debug(f"   ✓ {_module_name} import 성공")
+except (ImportError, AttributeError) as e:
+    logger.error(f"필수 모듈 import 실패: {e}")
+    messagebox.showerror("오류", "필수 모듈을 찾을 수 없습니다. 프로그램을 종료합니다.")
+    sys.exit(1)
+
+# 정적 분석/IDE가 이름을 인식하도록 명시적으로 바인딩
+get_config = _required["get_config"]
+get_erp_accounts = _required["get_erp_accounts"]
 
 
 class ReportAutomationGUI:
@@ -108,10 +90,39 @@ class ReportAutomationGUI:
             
             # 쓰레드 통신용 큐
             self.progress_queue = queue.Queue()
+            self.root.bind("<<ProgressEvent>>", self.drain_progress_queue)
+            
+            # 진행 메시지 태그별 처리 함수
+            self.progress_handlers = {
+                "SALES_PROGRESS": self.show_progress,
+                "SALES_RESULT": self.handle_sales_result,
+                "SALES_ERROR": self.handle_sales_error,
+                "SALES_PROCESSING_PROGRESS": self.show_progress,
+                "SALES_PROCESSING_RESULT": self.handle_sales_processing_result,
+                "SALES_PROCESSING_ERROR": self.handle_sales_processing_error,
+                "RECEIVABLES_PROGRESS": self.show_progress,
+                "RECEIVABLES_RESULT": self.handle_receivables_result,
+                "RECEIVABLES_ERROR": self.handle_receivables_error,
+            }
+            
+            # 작업 쓰레드 풀 (버튼 클릭마다 새 쓰레드를 만들지 않고 재사용)
+            self.executor = concurrent.futures.ThreadPoolExecutor(max_workers=2,
+                                                                  thread_name_prefix="gui-worker")
+            self._running_jobs = set()  # 실행 중/대기 중인 작업 Future
+            self.root.protocol("WM_DELETE_WINDOW", self.on_close)
             
             # 진행상황 추가 변수들
             self.current_task_total = 0
             self.current_task_step = 0
+            
+            # 주간 목록 캐시 (기준 날짜, 목록)
+            self._weeks_cache: Optional[tuple] = None
+            
+            # 상태 텍스트 스크롤 예약 여부
+            self._status_dirty = False
+            
+            # 처리된 데이터 파일 수 캐시 (폴더 mtime, 파일 수)
+            self._processed_count_cache: Optional[tuple] = None
                 
             self.setup_ui()
             self.setup_logging()
@@ -131,6 +142,40 @@ class ReportAutomationGUI:
         logging.basicConfig(level=logging.INFO, format=log_format)
         self.logger = logging.getLogger(__name__)
     
+    def load_data_collector(self):
+        """UnifiedDataCollector 지연 로드 (최초 사용 시 import 후 캐시)"""
+        if not hasattr(self, '_UnifiedDataCollector'):
+            from modules.data.unified_data_collector import UnifiedDataCollector
+            self._UnifiedDataCollector = UnifiedDataCollector
+        return self._UnifiedDataCollector
+    
+    def load_sales_analyzer(self):
+        """매출집계 main 함수 지연 로드"""
+        if not hasattr(self, '_analyze_sales'):
+            from modules.core.sales_calculator import main as analyze_sales
+            self._analyze_sales = analyze_sales
+        return self._analyze_sales
+    
+    def load_receivables_analyzer(self):
+        """매출채권 분석 main 함수 지연 로드"""
+        if not hasattr(self, '_analyze_receivables'):
+            from modules.core.accounts_receivable_analyzer import main as analyze_receivables
+            self._analyze_receivables = analyze_receivables
+        return self._analyze_receivables
+    
+    def load_report_generator(self):
+        """보고서 생성기 클래스 지연 로드 (없으면 None)"""
+        if not hasattr(self, '_WeeklyReportGenerator'):
+            self._WeeklyReportGenerator = next(
+                filter(None, (_try_import(module_name, attr)
+                              for module_name, attr in _REPORT_GENERATOR_CANDIDATES)),
+                None)
+            if self._WeeklyReportGenerator is None:
+                logger.warning("⚠️ 보고서 생성기를 찾을 수 없습니다")
+            else:
+                logger.debug(f"✅ {self._WeeklyReportGenerator.__name__} 로드 성공")
+        return self._WeeklyReportGenerator
+    
     def setup_ui(self):
         """UI 구성"""
         # 메인 프레임
@@ -290,62 +335,148 @@ class ReportAutomationGUI:
         if hasattr(self, 'status_text') and self.status_text:
             try:
                 self.status_text.insert(tk.END, f"[{datetime.now().strftime('%H:%M:%S')}] {message}\n")
-                self.status_text.see(tk.END)
-                self.root.update_idletasks()
+                self.schedule_status_flush()
             except Exception as e:
                 print(f"[{datetime.now().strftime('%H:%M:%S')}] {message}")
                 print(f"   ⚠️ GUI 상태 표시 오류: {e}")
         else:
             print(f"[{datetime.now().strftime('%H:%M:%S')}] {message}")
     
+    def update_status_batch(self, messages: Iterable[str]):
+        """여러 줄의 상태 메시지를 한 번의 insert로 추가 (타임스탬프는 한 번만 계산)"""
+        timestamp = datetime.now().strftime('%H:%M:%S')
+        block = "".join(f"[{timestamp}] {message}\n" for message in messages)
+        if not block:
+            return
+        if hasattr(self, 'status_text') and self.status_text:
+            try:
+                self.status_text.insert(tk.END, block)
+                self.schedule_status_flush()
+            except Exception as e:
+                print(block, end="")
+                print(f"   ⚠️ GUI 상태 표시 오류: {e}")
+        else:
+            print(block, end="")
+    
+    @staticmethod
+    def format_error_lines(error_detail, max_lines: int = 5) -> List[str]:
+        """오류 상세 내용의 앞부분을 들여쓰기된 줄 목록으로 변환"""
+        lines = str(error_detail).split('\n')[:max_lines]
+        return [f"   {line.strip()}" for line in lines if line.strip()]
+    
+    def schedule_status_flush(self):
+        """상태 텍스트 스크롤을 한 번에 모아서 처리 (연속 출력 시 16ms 단위)"""
+        if not self._status_dirty:
+            self._status_dirty = True
+            self.root.after(16, self.flush_status)
+    
+    def flush_status(self):
+        """상태 텍스트를 마지막 줄로 스크롤"""
+        self._status_dirty = False
+        self.status_text.see(tk.END)
+    
     def update_progress(self, message: str):
         """진행상황 업데이트"""
         self.progress_var.set(message)
         self.root.update_idletasks()
     
+    def post_progress(self, tag: str, payload):
+        """작업 쓰레드에서 메시지를 큐에 넣고 GUI 쓰레드에 이벤트로 알림"""
+        self.progress_queue.put((tag, payload))
+        self.notify_progress()
+    
+    def submit_job(self, worker):
+        """작업을 쓰레드 풀에 제출 (완료 시 진행 이벤트 발생)"""
+        future = self.executor.submit(worker)
+        self._running_jobs.add(future)
+        future.add_done_callback(self._running_jobs.discard)
+        future.add_done_callback(self.notify_progress)
+        return future
+    
+    def notify_progress(self, future=None):
+        """<<ProgressEvent>> 발생 (작업 완료 콜백으로도 사용)"""
+        try:
+            self.root.event_generate("<<ProgressEvent>>", when="tail")
+        except (tk.TclError, RuntimeError):
+            # 창이 이미 닫힌 경우
+            pass
+    
+    def drain_progress_queue(self, event=None):
+        """<<ProgressEvent>> 처리 - 큐에 쌓인 메시지를 모두 꺼내 처리"""
+        while True:
+            try:
+                item = self.progress_queue.get_nowait()
+            except queue.Empty:
+                break
+            self.dispatch_progress(item)
+    
+    def dispatch_progress(self, item):
+        """진행 메시지를 태그별 처리 함수로 전달"""
+        if not isinstance(item, tuple):
+            return
+        handler = self.progress_handlers.get(item[0])
+        if handler:
+            handler(item[1])
+    
+    def show_progress(self, message: str):
+        """작업 진행 메시지 표시"""
+        self.update_status(message)
+        self.update_progress(message)
+    
     def check_data_status(self):
         """데이터 현황 확인"""
         self.status_text.delete(1.0, tk.END)
-        self.update_status("🔍 리팩토링된 모듈 기반 데이터 현황 확인...")
+        msgs = ["🔍 리팩토링된 모듈 기반 데이터 현황 확인..."]
         
         try:
             # 리팩토링된 구조 정보 표시
-            self.update_status("✅ 리팩토링 완료 상태:")
-            self.update_status("   📁 modules/core/ - 핵심 분석 로직")
-            self.update_status("   📁 modules/data/ - 데이터 처리")
-            self.update_status("   📁 modules/gui/ - GUI 컴포넌트")
-            self.update_status("   📁 modules/utils/ - 유틸리티")
-            self.update_status("   📁 modules/reports/ - 보고서 생성")
-            self.update_status("")
+            msgs += [
+                "✅ 리팩토링 완료 상태:",
+                "   📁 modules/core/ - 핵심 분석 로직",
+                "   📁 modules/data/ - 데이터 처리",
+                "   📁 modules/gui/ - GUI 컴포넌트",
+                "   📁 modules/utils/ - 유틸리티",
+                "   📁 modules/reports/ - 보고서 생성",
+                "",
+            ]
             
             # 모듈 가용성 확인
-            self.update_status("🔧 모듈 가용성:")
-            if WeeklyReportGenerator:
-                self.update_status("   ✅ 보고서 생성기: 사용 가능")
+            msgs.append("🔧 모듈 가용성:")
+            if self.load_report_generator():
+                msgs.append("   ✅ 보고서 생성기: 사용 가능")
             else:
-                self.update_status("   ❌ 보고서 생성기: 사용 불가")
+                msgs.append("   ❌ 보고서 생성기: 사용 불가")
             
-            self.update_status("")
+            msgs.append("")
             
             # 파일 존재 확인
-            base_dir = Path(__file__).parent.parent
-            template_file = base_dir / "2025년도 주간보고 양식_2.xlsx"
-            processed_dir = base_dir / "data/processed"
-            
-            self.update_status("📂 파일 현황:")
-            if template_file.exists():
-                self.update_status("   ✅ 보고서 템플릿: 존재")
+            msgs.append("📂 파일 현황:")
+            if TEMPLATE_FILE.exists():
+                msgs.append("   ✅ 보고서 템플릿: 존재")
             else:
-                self.update_status("   ❌ 보고서 템플릿: 없음")
+                msgs.append("   ❌ 보고서 템플릿: 없음")
             
-            if processed_dir.exists():
-                excel_files = list(processed_dir.glob("*.xlsx"))
-                self.update_status(f"   📊 처리된 데이터: {len(excel_files)}개 파일")
+            if PROCESSED_DIR.exists():
+                msgs.append(f"   📊 처리된 데이터: {self.count_processed_files()}개 파일")
             else:
-                self.update_status("   📊 처리된 데이터: 디렉토리 없음")
+                msgs.append("   📊 처리된 데이터: 디렉토리 없음")
             
         except Exception as e:
-            self.update_status(f"❌ 데이터 현황 확인 중 오류: {e}")
+            msgs.append(f"❌ 데이터 현황 확인 중 오류: {e}")
+        
+        self.update_status_batch(msgs)
+    
+    def count_processed_files(self) -> int:
+        """처리된 데이터 폴더의 xlsx 파일 수 (폴더 mtime이 같으면 캐시 사용)"""
+        dir_mtime = os.stat(PROCESSED_DIR).st_mtime_ns
+        if self._processed_count_cache and self._processed_count_cache[0] == dir_mtime:
+            return self._processed_count_cache[1]
+        
+        with os.scandir(PROCESSED_DIR) as entries:
+            count = sum(1 for entry in entries if entry.name.endswith(".xlsx") and entry.is_file())
+        
+        self._processed_count_cache = (dir_mtime, count)
+        return count
     
     def get_selected_sales_period_months(self):
         """선택된 매출 수집 기간을 숫자로 변환"""
@@ -356,24 +487,28 @@ class ReportAutomationGUI:
             return 3  # 기본값
     
     def load_available_weeks(self):
-        """사용 가능한 주간 목록 로드"""
+        """사용 가능한 주간 목록 로드 (같은 날짜에는 캐시된 목록 재사용)"""
         try:
-            current_date = datetime.now()
-            
-            # 현재 날짜에서 가장 가까운 금요일 찾기
-            days_until_friday = (4 - current_date.weekday()) % 7
-            if days_until_friday == 0 and current_date.weekday() != 4:
-                days_until_friday = 7
-            
-            next_friday = current_date + timedelta(days=days_until_friday)
+            today = datetime.now().date()
             
-            # 최근 8주간의 금요일 목록 생성
-            friday_options = []
-            for i in range(8):
-                friday = next_friday - timedelta(weeks=i)
-                next_thursday = friday + timedelta(days=6)
-                display_text = f"{friday.strftime('%Y-%m-%d')} (금) ~ {next_thursday.strftime('%m-%d')} (목)"
-                friday_options.append(display_text)
+            if self._weeks_cache and self._weeks_cache[0] == today:
+                friday_options = self._weeks_cache[1]
+            else:
+                # 현재 날짜에서 가장 가까운 금요일 찾기
+                days_until_friday = (4 - today.weekday()) % 7
+                if days_until_friday == 0 and today.weekday() != 4:
+                    days_until_friday = 7
+                
+                next_friday = today + timedelta(days=days_until_friday)
+                
+                # 최근 8주간의 금요일 목록 생성
+                friday_options = []
+                for i in range(8):
+                    friday = next_friday - timedelta(weeks=i)
+                    next_thursday = friday + timedelta(days=6)
+                    friday_options.append(f"{friday:%Y-%m-%d} (금) ~ {next_thursday:%m-%d} (목)")
+                
+                self._weeks_cache = (today, friday_options)
             
             self.friday_combobox['values'] = friday_options
             if friday_options:
@@ -389,10 +524,11 @@ class ReportAutomationGUI:
         
         def sales_worker():
             try:
-                self.progress_queue.put(("SALES_PROGRESS", "🔧 리팩토링된 데이터 수집기 초기화 중..."))
+                self.post_progress("SALES_PROGRESS", "🔧 리팩토링된 데이터 수집기 초기화 중...")
+                UnifiedDataCollector = self.load_data_collector()
                 collector = UnifiedDataCollector(months=selected_months)
                 
-                self.progress_queue.put(("SALES_PROGRESS", "🌐 브라우저 시작 중..."))
+                self.post_progress("SALES_PROGRESS", "🌐 브라우저 시작 중...")
                 
                 # 매출 데이터만 수집
                 result = collector.collect_all_data(months_back=selected_months, sales_only=True)
@@ -411,49 +547,16 @@ class ReportAutomationGUI:
                         "error": "매출 데이터 수집 실패"
                     }
                 
-                self.progress_queue.put(("SALES_RESULT", success_result))
+                self.post_progress("SALES_RESULT", success_result)
                 
             except Exception as e:
                 import traceback
                 error_detail = f"{str(e)}\n{traceback.format_exc()}"
-                self.progress_queue.put(("SALES_ERROR", error_detail))
+                self.post_progress("SALES_ERROR", error_detail)
         
         self.update_status("⏳ 데이터 수집에는 5-10분이 소요될 수 있습니다...")
         
-        thread = threading.Thread(target=sales_worker)
-        thread.daemon = True
-        thread.start()
-        
-        self.monitor_sales_progress()
-    
-    def monitor_sales_progress(self):
-        """매출 데이터 갱신 진행상황 모니터링"""
-        try:
-            while True:
-                item = self.progress_queue.get_nowait()
-                
-                if isinstance(item, tuple):
-                    if item[0] == "SALES_PROGRESS":
-                        self.update_status(item[1])
-                        self.update_progress(item[1])
-                    elif item[0] == "SALES_RESULT":
-                        self.handle_sales_result(item[1])
-                        break
-                    elif item[0] == "SALES_ERROR":
-                        self.update_status(f"❌ 매출 데이터 갱신 오류:")
-                        error_lines = str(item[1]).split('\n')
-                        for line in error_lines[:5]:
-                            if line.strip():
-                                self.update_status(f"   {line.strip()}")
-                        
-                        self.sales_button.config(state='normal')
-                        self.update_progress("매출 데이터 갱신 실패")
-                        break
-                        
-        except queue.Empty:
-            pass
-        
-        self.root.after(100, self.monitor_sales_progress)
+        self.submit_job(sales_worker)
     
     def handle_sales_result(self, result):
         """매출 데이터 갱신 결과 처리"""
@@ -471,6 +574,13 @@ class ReportAutomationGUI:
             error_msg = result.get("error", "알 수 없는 오류")
             self.update_status(f"❌ 매출 데이터 갱신 실패: {error_msg}")
     
+    def handle_sales_error(self, error_detail):
+        """매출 데이터 갱신 오류 처리"""
+        self.update_status_batch(["❌ 매출 데이터 갱신 오류:"] + self.format_error_lines(error_detail))
+        
+        self.sales_button.config(state='normal')
+        self.update_progress("매출 데이터 갱신 실패")
+    
     def start_sales_processing(self):
         """매출집계 처리 시작"""
         self.update_status("리팩토링된 매출집계 처리를 시작합니다...")
@@ -478,10 +588,11 @@ class ReportAutomationGUI:
         
         def processing_worker():
             try:
-                self.progress_queue.put(("SALES_PROCESSING_PROGRESS", "🔍 원시 매출 데이터 확인 중..."))
-                self.progress_queue.put(("SALES_PROCESSING_PROGRESS", "📈 리팩토링된 매출집계 처리 중..."))
+                self.post_progress("SALES_PROCESSING_PROGRESS", "🔍 원시 매출 데이터 확인 중...")
+                self.post_progress("SALES_PROCESSING_PROGRESS", "📈 리팩토링된 매출집계 처리 중...")
                 
                 # 리팩토링된 sales_calculator 모듈 사용
+                analyze_sales = self.load_sales_analyzer()
                 result = analyze_sales()
                 
                 if result:
@@ -496,47 +607,14 @@ class ReportAutomationGUI:
                         "error": "매출집계 처리 실패"
                     }
                 
-                self.progress_queue.put(("SALES_PROCESSING_RESULT", success_result))
+                self.post_progress("SALES_PROCESSING_RESULT", success_result)
                 
             except Exception as e:
                 import traceback
                 error_detail = f"{str(e)}\n{traceback.format_exc()}"
-                self.progress_queue.put(("SALES_PROCESSING_ERROR", error_detail))
+                self.post_progress("SALES_PROCESSING_ERROR", error_detail)
         
-        thread = threading.Thread(target=processing_worker)
-        thread.daemon = True
-        thread.start()
-        
-        self.monitor_sales_processing_progress()
-    
-    def monitor_sales_processing_progress(self):
-        """매출집계 처리 진행상황 모니터링"""
-        try:
-            while True:
-                item = self.progress_queue.get_nowait()
-                
-                if isinstance(item, tuple):
-                    if item[0] == "SALES_PROCESSING_PROGRESS":
-                        self.update_status(item[1])
-                        self.update_progress(item[1])
-                    elif item[0] == "SALES_PROCESSING_RESULT":
-                        self.handle_sales_processing_result(item[1])
-                        break
-                    elif item[0] == "SALES_PROCESSING_ERROR":
-                        self.update_status(f"❌ 매출집계 처리 오류:")
-                        error_lines = str(item[1]).split('\n')
-                        for line in error_lines[:5]:
-                            if line.strip():
-                                self.update_status(f"   {line.strip()}")
-                        
-                        self.sales_process_button.config(state='normal')
-                        self.update_progress("매출집계 처리 실패")
-                        break
-                        
-        except queue.Empty:
-            pass
-        
-        self.root.after(100, self.monitor_sales_processing_progress)
+        self.submit_job(processing_worker)
     
     def handle_sales_processing_result(self, result):
         """매출집계 처리 결과 처리"""
@@ -553,6 +631,13 @@ class ReportAutomationGUI:
             self.update_status(f"❌ 매출집계 처리 실패: {error_msg}")
             self.update_progress("매출집계 처리 실패")
     
+    def handle_sales_processing_error(self, error_detail):
+        """매출집계 처리 오류 처리"""
+        self.update_status_batch(["❌ 매출집계 처리 오류:"] + self.format_error_lines(error_detail))
+        
+        self.sales_process_button.config(state='normal')
+        self.update_progress("매출집계 처리 실패")
+    
     def start_receivables_analysis(self):
         """매출채권 분석 실행"""
         self.update_status("💰 매출채권 분석을 시작합니다...")
@@ -560,8 +645,9 @@ class ReportAutomationGUI:
         
         def analysis_worker():
             try:
-                self.progress_queue.put(("RECEIVABLES_PROGRESS", "🔧 매출채권 분석기 초기화..."))
+                self.post_progress("RECEIVABLES_PROGRESS", "🔧 매출채권 분석기 초기화...")
                 
+                analyze_receivables = self.load_receivables_analyzer()
                 result = analyze_receivables()
                 
                 if result:
@@ -575,38 +661,14 @@ class ReportAutomationGUI:
                         "error": "매출채권 분석 실패"
                     }
                 
-                self.progress_queue.put(("RECEIVABLES_RESULT", success_result))
+                self.post_progress("RECEIVABLES_RESULT", success_result)
                 
             except Exception as e:
                 import traceback
                 error_detail = f"{str(e)}\n{traceback.format_exc()}"
-                self.progress_queue.put(("RECEIVABLES_ERROR", error_detail))
-        
-        thread = threading.Thread(target=analysis_worker)
-        thread.daemon = True
-        thread.start()
+                self.post_progress("RECEIVABLES_ERROR", error_detail)
         
-        self.monitor_receivables_progress()
-    
-    def monitor_receivables_progress(self):
-        """매출채권 분석 진행상황 모니터링"""
-        try:
-            while True:
-                item = self.progress_queue.get_nowait()
-                
-                if isinstance(item, tuple):
-                    if item[0] == "RECEIVABLES_RESULT":
-                        self.handle_receivables_result(item[1])
-                        break
-                    elif item[0] == "RECEIVABLES_ERROR":
-                        self.update_status(f"❌ 매출채권 분석 오류: {item[1]}")
-                        self.receivables_button.config(state='normal')
-                        break
-                        
-        except queue.Empty:
-            pass
-        
-        self.root.after(100, self.monitor_receivables_progress)
+        self.submit_job(analysis_worker)
     
     def handle_receivables_result(self, result):
         """매출채권 분석 결과 처리"""
@@ -618,6 +680,11 @@ class ReportAutomationGUI:
             error_msg = result.get("error", "알 수 없는 오류")
             self.update_status(f"❌ 매출채권 분석 실패: {error_msg}")
     
+    def handle_receivables_error(self, error_detail):
+        """매출채권 분석 오류 처리"""
+        self.update_status(f"❌ 매출채권 분석 오류: {error_detail}")
+        self.receivables_button.config(state='normal')
+    
     def start_full_process(self):
         """전체 프로세스 실행"""
         self.update_status("리팩토링된 전체 프로세스를 시작합니다...")
@@ -640,7 +707,7 @@ class ReportAutomationGUI:
         """보고서만 생성"""
         self.update_status("리팩토링된 보고서 생성을 시작합니다...")
         
-        if WeeklyReportGenerator is None:
+        if self.load_report_generator() is None:
             messagebox.showerror("오류", "리팩토링된 보고서 생성 모듈을 사용할 수 없습니다.")
             return
         
@@ -653,9 +720,31 @@ class ReportAutomationGUI:
             self.update_status(f"❌ 보고서 생성 오류: {e}")
             messagebox.showerror("오류", f"보고서 생성 중 오류:\n{e}")
     
+    def on_close(self):
+        """창 닫기 - 대기 중인 작업을 취소하고 종료"""
+        self.executor.shutdown(wait=False, cancel_futures=True)
+        
+        # 수집 중인 브라우저를 닫아 진행 중인 Selenium 작업이 바로 실패하도록 함
+        # (수집 모듈을 사용한 적이 없으면 import하지 않음)
+        browser_pool = sys.modules.get("modules.data.collectors.browser_pool")
+        if browser_pool is not None:
+            browser_pool.drain_pool(force=True)
+        
+        self.root.destroy()
+    
     def run(self):
         """GUI 실행"""
         self.root.mainloop()
+        
+        # 쓰레드 풀 작업자는 daemon이 아니어서 인터프리터 종료 시 join됨
+        # - on_close에서 대기 작업을 취소하고 브라우저를 강제 종료했으므로 진행 중인 작업도 곧 끝남
+        # - 강제 종료(os._exit)하지 않아야 finally/atexit 정리(워크북 저장, 임시 파일 삭제, 로그 flush)가 실행됨
+        pending = [future for future in list(getattr(self, '_running_jobs', ())) if not future.done()]
+        if pending:
+            print("⏳ 진행 중인 작업을 정리하고 있습니다...")
+            _, not_done = concurrent.futures.wait(pending, timeout=30)
+            if not_done:
+                logging.warning("작업이 아직 진행 중입니다 - 작업이 끝나면 프로그램이 종료됩니다.")
 
 
 def main():
@@ -4,6 +4,7 @@ Auto Sales Report Generator v3.1
 매출 보고서 자동 생성 시스템 메인 실행 파일 - 통합 매출채권 처리기 적용
 """
 
+import os
 import sys
 import argparse
 import logging  # logging을 전역으로 이동
@@ -274,6 +275,12 @@ def main():
     # 로깅 설정
     logger = setup_logging(args.quiet)
     
+    # CLI 실행은 기본 헤드리스 (--show-browser 지정 시 브라우저 표시, HEADLESS 환경변수가 있으면 그대로 사용)
+    if args.show_browser:
+        os.environ["HEADLESS"] = "0"
+    else:
+        os.environ.setdefault("HEADLESS", "1")
+    
     # weeks 기본값 설정
     if args.weeks is None:
         args.weeks = args.months * 4
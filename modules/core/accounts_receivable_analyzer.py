@@ -1,84 +1,205 @@
 import pandas as pd
+import numpy as np
 import os
 from pathlib import Path
-from datetime import datetime, timedelta
-import sys
+from datetime import datetime, timedelta, date
 import re
 import logging
-
-# 리팩토링된 경로 설정
-sys.path.append(str(Path(__file__).parent.parent))
+import functools
+from typing import NamedTuple, Optional
 
 # 설정 관리자 import (새 구조)
 from modules.utils.config_manager import get_config
+from modules.utils.excel_engine import EXCEL_ENGINE
+
+
+def _safe_ratio(numerator, denominator):
+    """벡터화된 안전한 나눗셈 (분모가 0이거나 값이 NaN이면 0.0)"""
+    numerator = np.asarray(numerator, dtype="float64")
+    denominator = np.asarray(denominator, dtype="float64")
+    valid = (denominator != 0) & ~np.isnan(numerator) & ~np.isnan(denominator)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return np.where(valid, numerator / denominator, 0.0)
+
+
+def _round_half(values, decimals):
+    """요소별 내장 round() 적용 (기존 행 단위 계산과 같은 결과)
+
+    numpy의 .round()는 10**decimals 배율 후 짝수 반올림이라 경계값에서 결과가 달라짐 (예: 0.1005 * 100 → 10.0, round() → 10.1)
+    """
+    values = np.asarray(values, dtype="float64")
+    return np.array([round(value, decimals) for value in values.tolist()], dtype="float64")
+
+
+# 매출채권 분석에 필요한 컬럼 (원본 시트를 저장하지 않을 때는 그 외 컬럼을 읽지 않음)
+RECEIVABLE_COLUMNS = ["거래처코드", "거래처명", "총채권", "기간초과 매출채권", "90일초과 매출채권"]
+AMOUNT_COLUMNS = ["총채권", "기간초과 매출채권", "90일초과 매출채권"]
+RECEIVABLE_DTYPES = {"거래처코드": str, "거래처명": str}
+
+# 시트별 DataFrame의 컬럼 타입 - 병합 전에 맞춰두면 concat 시 타입 변환이 생기지 않음
+FRAME_DTYPES = {"회사": object, "거래처코드": object, "거래처명": object,
+                **{col: "float64" for col in AMOUNT_COLUMNS}}
+
+
+def _is_client_name_column(col) -> bool:
+    """거래처명 컬럼 여부 ("거래처명" 외에 "거래처 명" 같은 변형 헤더도 허용)"""
+    col = str(col)
+    return "거래처" in col and "명" in col
+
+
+def _is_receivable_column(col) -> bool:
+    """분석에 필요한 컬럼 여부 (read_excel usecols 용)"""
+    return col in RECEIVABLE_COLUMNS or _is_client_name_column(col)
+
+
+@functools.lru_cache(maxsize=4)
+def _load_receivable_frame(file_path: str, mtime_ns: int, all_columns: bool = True):
+    """매출채권 엑셀 파일 파싱 (경로+수정시각 기준 캐시, 호출자는 복사본을 사용)
+    
+    all_columns=False 이면 분석에 필요한 컬럼만 읽음 (원본 시트를 저장하지 않는 경우)
+    """
+    logger = logging.getLogger('AccountsReceivableAnalyzer')
+    frames = []
+    
+    # 모든 시트를 한 번의 파싱으로 읽은 뒤 시트명으로 회사 구분
+    all_sheets = pd.read_excel(file_path, sheet_name=None, engine=EXCEL_ENGINE,
+                               usecols=None if all_columns else _is_receivable_column,
+                               dtype=RECEIVABLE_DTYPES)
+    for sheet, df in all_sheets.items():
+        if "디앤드디" in sheet or "디앤아이" in sheet:
+            company = "디앤드디" if "디앤드디" in sheet else "디앤아이"
+            df["회사"] = company
+            
+            # 금액 컬럼은 읽는 시점에 숫자로 변환 (숫자가 아닌 값은 NaN)
+            for col in AMOUNT_COLUMNS:
+                if col in df.columns:
+                    df[col] = pd.to_numeric(df[col], errors="coerce")
+            
+            # 합계 행(거래처명이 "합계")과 거래처코드가 비어있거나 숫자가 아닌 행을
+            # 하나의 마스크로 한 번에 제외
+            mask = np.ones(len(df), dtype=bool)
+            if "거래처명" in df.columns:
+                mask &= df["거래처명"].to_numpy() != "합계"
+            if "거래처코드" in df.columns:
+                codes = df["거래처코드"]
+                if not pd.api.types.is_numeric_dtype(codes):
+                    codes = pd.to_numeric(codes, errors='coerce')
+                mask &= codes.notna().to_numpy()
+            
+            if not mask.all():
+                logger.debug(f"{company}: 합계/유효하지 않은 거래처코드 행 {int((~mask).sum())}개 제외됨")
+                df = df.loc[mask]
+            
+            frames.append(df.astype({col: dtype for col, dtype in FRAME_DTYPES.items() if col in df.columns}))
+    
+    if not frames:
+        return pd.DataFrame()
+    
+    # 시트별 데이터를 한 번에 병합 (groupby 키인 회사/거래처명은 category로 저장)
+    df_all = pd.concat(frames, ignore_index=True)
+    df_all["회사"] = df_all["회사"].astype("category")
+    for col in df_all.columns:
+        if _is_client_name_column(col):
+            df_all[col] = df_all[col].astype("category")
+    return df_all
+
+
+@functools.lru_cache(maxsize=4)
+def _list_receivable_files(dir_path: str, mtime_ns: int):
+    """매출채권 원본 파일 목록 (폴더 경로+수정시각 기준 캐시 - 파일 추가/삭제 시 자동 갱신)"""
+    with os.scandir(dir_path) as entries:
+        return tuple(
+            Path(entry.path) for entry in entries
+            if entry.name.startswith("매출채권계산결과") and entry.name.lower().endswith(".xlsx")
+        )
+
+
+# 파일명 날짜 패턴 - 세 가지 형식을 하나의 정규식으로 한 번에 검색
+#   ymd : 매출채권계산결과YYYYMMDD.xlsx
+#   iso : 매출채권계산결과(YYYY-MM-DD).xlsx
+#   dash: 매출채권계산결과YYYY-MM-DD.xlsx (하이픈 형식)
+_DATE_RE = re.compile(
+    r'매출채권계산결과(?:(?P<ymd>\d{8})|\((?P<iso>\d{4}-\d{2}-\d{2})\)|(?P<dash>\d{4}-\d{2}-\d{2}))\.xlsx',
+    re.IGNORECASE  # Windows 파일명은 대소문자 구분이 없으므로 .XLSX 도 허용
+)
+
+
+@functools.lru_cache(maxsize=512)
+def _extract_date(filename: str):
+    """파일명에서 날짜 추출 (결과는 파일명별로 캐시)"""
+    match = _DATE_RE.search(filename)
+    if not match:
+        return None
+    
+    try:
+        if match['ymd']:
+            return datetime.strptime(match['ymd'], '%Y%m%d').date()
+        return datetime.strptime(match['iso'] or match['dash'], '%Y-%m-%d').date()
+    except ValueError:
+        # 형식은 맞지만 존재하지 않는 날짜 (예: 20251340)
+        return None
+
+
+class FileRef(NamedTuple):
+    """선택된 매출채권 파일 정보 (날짜 추출/주차 분류는 선택 시 한 번만 수행)"""
+    path: Path
+    date: Optional[date]
+    week_label: str
+
 
 class ReceivablesAnalyzer:
     """매출채권 분석 엔진 클래스 - 리팩토링된 버전"""
     
     def __init__(self):
-        self.config = get_config()
         self.logger = logging.getLogger('ReceivablesAnalyzer')
     
+    @functools.cached_property
+    def config(self):
+        """설정 관리자 (처음 사용할 때 한 번만 로드)"""
+        return get_config()
+    
     def find_best_file_for_week(self, files_with_dates, target_date):
         """주차에 맞는 최적 파일 찾기"""
         week_start = target_date - timedelta(days=target_date.weekday())
         week_end = week_start + timedelta(days=6)
         
-        # 해당 주 내 파일들 찾기
-        week_files = [
-            (file_path, file_date) for file_path, file_date in files_with_dates
-            if week_start <= file_date <= week_end
-        ]
-        
-        if week_files:
-            # 해당 주에서 가장 늦은 파일 선택
-            return max(week_files, key=lambda x: x[1])
-        
-        # 해당 주에 파일이 없으면 가장 가까운 파일 찾기
-        if not files_with_dates:
-            return None
+        # 한 번의 순회로 "해당 주의 가장 늦은 파일"과 "기준일에 가장 가까운 파일"을 함께 찾음
+        best_in_week = None
+        closest_file = None
+        closest_dist = None
+        for file_path, file_date in files_with_dates:
+            if week_start <= file_date <= week_end:
+                if best_in_week is None or file_date > best_in_week[1]:
+                    best_in_week = (file_path, file_date)
+            
+            dist = abs((file_date - target_date).days)
+            if closest_dist is None or dist < closest_dist:
+                closest_dist, closest_file = dist, (file_path, file_date)
         
-        closest_file = min(files_with_dates, key=lambda x: abs((x[1] - target_date).days))
-        return closest_file
+        # 해당 주에 파일이 없으면 가장 가까운 파일 (파일이 없으면 None)
+        return best_in_week or closest_file
 
 
 class AccountsReceivableAnalyzer:
     """매출채권 분석 클래스 - 월~금 기준 (리팩토링됨)"""
     
     def __init__(self):
-        self.config = get_config()
         # 통합 로거 사용
         self.logger = logging.getLogger('AccountsReceivableAnalyzer')
+    
+    @functools.cached_property
+    def config(self):
+        """설정 관리자 (처음 사용할 때 한 번만 로드)"""
+        return get_config()
         
-    def read_data(self, file_path):
-        """엑셀 파일에서 매출채권 데이터 읽기"""
-        df_all = pd.DataFrame()
+    def read_data(self, file_path, all_columns=True):
+        """엑셀 파일에서 매출채권 데이터 읽기 (같은 파일은 캐시된 결과의 복사본 반환)
         
+        all_columns=False 이면 분석에 필요한 컬럼(거래처코드/거래처명/금액)만 읽음
+        """
         try:
-            xl = pd.ExcelFile(file_path)
-            for sheet in xl.sheet_names:
-                if "디앤드디" in sheet or "디앤아이" in sheet:
-                    company = "디앤드디" if "디앤드디" in sheet else "디앤아이"
-                    df = xl.parse(sheet)
-                    df["회사"] = company
-                    
-                    # 합계 행 제외 (거래처명이 "합계"인 행)
-                    if "거래처명" in df.columns:
-                        before_count = len(df)
-                        df = df[df["거래처명"] != "합계"]
-                        after_count = len(df)
-                        if before_count != after_count:
-                            self.logger.debug(f"{company}: 합계 행 {before_count - after_count}개 제외됨")
-                    
-                    # 거래처코드가 비어있거나 숫자가 아닌 행도 제외 (추가 안전장치)
-                    if "거래처코드" in df.columns:
-                        before_count = len(df)
-                        df = df[pd.to_numeric(df["거래처코드"], errors='coerce').notna()]
-                        after_count = len(df)
-                        if before_count != after_count:
-                            self.logger.debug(f"{company}: 유효하지 않은 거래처코드 행 {before_count - after_count}개 제외됨")
-                    
-                    df_all = pd.concat([df_all, df], ignore_index=True)
+            file_path = Path(file_path)
+            df_all = _load_receivable_frame(str(file_path), file_path.stat().st_mtime_ns, all_columns).copy()
                     
             print(f"  📄 데이터 로드: {len(df_all)}행")
             self.logger.info(f"데이터 로드 완료: {file_path}")
@@ -91,57 +212,9 @@ class AccountsReceivableAnalyzer:
             self.logger.error(error_msg)
             return pd.DataFrame()
 
-    def safe_round(self, value, decimals=4):
-        """안전한 반올림 함수"""
-        try:
-            if pd.isna(value):
-                return 0.0
-            return round(float(value), decimals)
-        except:
-            return 0.0
-
-    def safe_divide(self, numerator, denominator, decimals=4):
-        """안전한 나눗셈 함수"""
-        try:
-            if denominator == 0 or pd.isna(denominator) or pd.isna(numerator):
-                return 0.0
-            result = float(numerator) / float(denominator)
-            return self.safe_round(result, decimals)
-        except:
-            return 0.0
-
     def extract_date_from_filename(self, filename):
         """파일명에서 날짜 추출 (다양한 형식 지원)"""
-        from datetime import datetime
-        
-        # 패턴 1: 매출채권계산결과YYYYMMDD.xlsx
-        match1 = re.search(r'매출채권계산결과(\d{8})\.xlsx', str(filename))
-        if match1:
-            try:
-                date_str = match1.group(1)
-                return datetime.strptime(date_str, '%Y%m%d').date()
-            except ValueError:
-                pass
-        
-        # 패턴 2: 매출채권계산결과(YYYY-MM-DD).xlsx  
-        match2 = re.search(r'매출채권계산결과\((\d{4}-\d{2}-\d{2})\)\.xlsx', str(filename))
-        if match2:
-            try:
-                date_str = match2.group(1)
-                return datetime.strptime(date_str, '%Y-%m-%d').date()
-            except ValueError:
-                pass
-        
-        # 패턴 3: 매출채권계산결과YYYY-MM-DD.xlsx (하이픈 형식)
-        match3 = re.search(r'매출채권계산결과(\d{4}-\d{2}-\d{2})\.xlsx', str(filename))
-        if match3:
-            try:
-                date_str = match3.group(1)
-                return datetime.strptime(date_str, '%Y-%m-%d').date()
-            except ValueError:
-                pass
-                
-        return None
+        return _extract_date(str(filename))
 
     def get_week_start_monday(self, date):
         """주어진 날짜가 속한 주의 월요일 반환 (월~금 기준으로 변경)"""
@@ -188,7 +261,10 @@ class AccountsReceivableAnalyzer:
         receivable_dir = self.config.get_receivable_raw_data_dir()
         
         # 매출채권 파일 찾기
-        receivable_files = list(receivable_dir.glob("매출채권계산결과*.xlsx"))
+        try:
+            receivable_files = _list_receivable_files(str(receivable_dir), os.stat(receivable_dir).st_mtime_ns)
+        except OSError:
+            receivable_files = ()
         if not receivable_files:
             error_msg = "매출채권 파일을 찾을 수 없습니다."
             print(f"  ❌ {error_msg}")
@@ -213,9 +289,22 @@ class AccountsReceivableAnalyzer:
                 self.logger.warning(f"파일명에서 날짜 추출 실패: {file_path.name}")
                 files_by_week["기타"].append((file_path, None))
 
+        # 날짜가 있는 모든 파일 (최신순) - 대체 파일 선택 시 재사용
+        all_valid_sorted = sorted(
+            ((path, file_date) for week_files in files_by_week.values()
+             for path, file_date in week_files if file_date is not None),
+            key=lambda x: x[1], reverse=True
+        )
+        
+        def latest_other_than(exclude_path):
+            """exclude_path를 제외한 가장 최신 파일 (없으면 None)"""
+            return next((f for f in all_valid_sorted if f[0] != exclude_path), None)
+
         # 각 주차별로 가장 최신 파일 선택
         curr_file_path = None
         prev_file_path = None
+        curr_date = None
+        prev_date = None
         
         # 이번주 파일 중 최신 파일
         if files_by_week["이번주"]:
@@ -232,37 +321,30 @@ class AccountsReceivableAnalyzer:
             self.logger.warning("이번주 파일이 없습니다.")
             
             # 모든 유효한 파일 중 가장 최신 파일을 현재 주로 사용
-            all_valid_files = []
-            for week_files in files_by_week.values():
-                all_valid_files.extend([f for f in week_files if f[1] is not None])
-            
-            if all_valid_files:
-                curr_file_path, curr_date = max(all_valid_files, key=lambda x: x[1])
-                curr_week_label = self.classify_week_by_date(curr_date) if curr_date else "알수없음"
+            if all_valid_sorted:
+                curr_file_path, curr_date = all_valid_sorted[0]
+                curr_week_label = self.classify_week_by_date(curr_date)
                 self.logger.info(f"대체 현재 파일: {curr_file_path.name} (날짜: {curr_date}, 실제주차: {curr_week_label})")
                 
                 # 전주 파일 재선택
-                remaining_files = [f for f in all_valid_files if f[0] != curr_file_path]
-                if remaining_files:
-                    if prev_file_path is None or prev_file_path == curr_file_path:
-                        prev_file_path, prev_date = max(remaining_files, key=lambda x: x[1])
-                        prev_week_label = self.classify_week_by_date(prev_date) if prev_date else "알수없음"
+                if prev_file_path is None or prev_file_path == curr_file_path:
+                    remaining = latest_other_than(curr_file_path)
+                    if remaining:
+                        prev_file_path, prev_date = remaining
+                        prev_week_label = self.classify_week_by_date(prev_date)
                         self.logger.info(f"대체 전주 파일: {prev_file_path.name} (날짜: {prev_date}, 실제주차: {prev_week_label})")
 
         # 파일이 같은 경우 처리
         if curr_file_path and prev_file_path and curr_file_path == prev_file_path:
             self.logger.warning("현재 주와 전주 파일이 동일합니다. 전주 파일을 다시 선택합니다.")
             
-            all_valid_files = []
-            for week_files in files_by_week.values():
-                all_valid_files.extend([f for f in week_files if f[1] is not None])
-            
-            remaining_files = [f for f in all_valid_files if f[0] != curr_file_path]
-            if remaining_files:
-                prev_file_path, prev_date = max(remaining_files, key=lambda x: x[1])
+            remaining = latest_other_than(curr_file_path)
+            if remaining:
+                prev_file_path, prev_date = remaining
                 self.logger.info(f"수정된 전주 파일: {prev_file_path.name} (날짜: {prev_date})")
             else:
                 prev_file_path = None
+                prev_date = None
                 self.logger.info("전주 파일 없음 - 단일 파일로 분석")
 
         if prev_file_path is None and curr_file_path is not None:
@@ -274,7 +356,17 @@ class AccountsReceivableAnalyzer:
         if prev_file_path:
             print(f"  📄 전주 (월~금): {prev_file_path.name}")
         
-        return curr_file_path, prev_file_path
+        curr_ref = self.make_file_ref(curr_file_path, curr_date, reference_date) if curr_file_path else None
+        prev_ref = self.make_file_ref(prev_file_path, prev_date, reference_date) if prev_file_path else None
+        return curr_ref, prev_ref
+
+    def make_file_ref(self, file_path, file_date=None, reference_date=None):
+        """파일 경로를 FileRef로 변환 (날짜를 모르면 파일명에서 추출)"""
+        file_path = Path(file_path)
+        if file_date is None:
+            file_date = self.extract_date_from_filename(file_path.name)
+        week_label = self.classify_week_by_date(file_date, reference_date) if file_date else "알수없음"
+        return FileRef(file_path, file_date, week_label)
 
     def find_latest_files(self):
         """최신 파일들 자동 찾기 - 주간 기준 방식 사용 (월~금)"""
@@ -291,13 +383,17 @@ class AccountsReceivableAnalyzer:
         numeric_columns = ["총채권", "기간초과 매출채권", "90일초과 매출채권"]
         for col in numeric_columns:
             if col in df.columns:
-                df[col] = pd.to_numeric(df[col], errors="coerce").fillna(0)
+                # read_data에서 이미 숫자형으로 변환된 컬럼은 재변환 생략, 결측값이 있을 때만 0으로 채움
+                if not pd.api.types.is_numeric_dtype(df[col]):
+                    df[col] = pd.to_numeric(df[col], errors="coerce")
+                if df[col].isna().any():
+                    df[col] = df[col].fillna(0)
             else:
                 self.logger.warning(f"컬럼 '{col}'이 없습니다. 0으로 설정합니다.")
                 df[col] = 0
 
         # 회사별 집계
-        summary = df.groupby("회사").agg({
+        summary = df.groupby("회사", observed=True).agg({
             "총채권": "sum",
             "90일초과 매출채권": "sum",
             "기간초과 매출채권": "sum"
@@ -313,34 +409,37 @@ class AccountsReceivableAnalyzer:
 
         final = pd.concat([summary, total_row], ignore_index=True)
         
-        # 비율 계산을 안전하게 수행
-        final["90일비율"] = 0.0
-        final["기간초과비율"] = 0.0
+        # 비율 계산 (컬럼 단위 벡터 연산, 총채권이 0이면 0.0)
+        total = final["총채권"].to_numpy(dtype="float64")
+        ratios_90 = _safe_ratio(final["90일초과 매출채권"], total)
+        ratios_overdue = _safe_ratio(final["기간초과 매출채권"], total)
         
-        for idx, row in final.iterrows():
-            final.at[idx, "90일비율"] = self.safe_divide(row["90일초과 매출채권"], row["총채권"])
-            final.at[idx, "기간초과비율"] = self.safe_divide(row["기간초과 매출채권"], row["총채권"])
-        
-        return final
+        return final.assign(**{
+            "90일비율": _round_half(ratios_90, 4),
+            "기간초과비율": _round_half(ratios_overdue, 4),
+        })
 
     def make_comparison(self, curr_summary, prev_summary):
         """전주 vs 금주 비교 분석 (계산 결과 시트용 - 원래 형태로 복원)"""
         if curr_summary.empty or prev_summary.empty:
             return curr_summary.copy() if not curr_summary.empty else pd.DataFrame()
             
-        merged = curr_summary.merge(prev_summary, on="회사", suffixes=("_curr", "_prev"))
-        
-        result = pd.DataFrame()
-        result["항목"] = merged["회사"]
-        result["총채권(전주)"] = merged["총채권_prev"]
-        result["총채권(금주)"] = merged["총채권_curr"]
-        result["총채권(증감)"] = merged["총채권_curr"] - merged["총채권_prev"]
-        result["장기미수채권90일(전주)"] = merged["90일초과 매출채권_prev"]
-        result["장기미수채권90일(금주)"] = merged["90일초과 매출채권_curr"]
-        result["장기미수채권90일(증감)"] = merged["90일초과 매출채권_curr"] - merged["90일초과 매출채권_prev"]
-        result["90일비율(금주)"] = merged["90일비율_curr"]
-        result["기간초과채권(금주)"] = merged["기간초과 매출채권_curr"]
-        result["기간초과비율(금주)"] = merged["기간초과비율_curr"]
+        merged = curr_summary.merge(prev_summary, on="회사", how="inner",
+                                    suffixes=("_curr", "_prev"), validate="one_to_one")
+        
+        # 컬럼별 배열을 미리 만들어 한 번에 DataFrame 생성
+        result = pd.DataFrame({
+            "항목": merged["회사"].to_numpy(),
+            "총채권(전주)": merged["총채권_prev"].to_numpy(),
+            "총채권(금주)": merged["총채권_curr"].to_numpy(),
+            "총채권(증감)": (merged["총채권_curr"] - merged["총채권_prev"]).to_numpy(),
+            "장기미수채권90일(전주)": merged["90일초과 매출채권_prev"].to_numpy(),
+            "장기미수채권90일(금주)": merged["90일초과 매출채권_curr"].to_numpy(),
+            "장기미수채권90일(증감)": (merged["90일초과 매출채권_curr"] - merged["90일초과 매출채권_prev"]).to_numpy(),
+            "90일비율(금주)": merged["90일비율_curr"].to_numpy(),
+            "기간초과채권(금주)": merged["기간초과 매출채권_curr"].to_numpy(),
+            "기간초과비율(금주)": merged["기간초과비율_curr"].to_numpy(),
+        })
         
         return result
 
@@ -349,69 +448,43 @@ class AccountsReceivableAnalyzer:
         if curr_summary.empty:
             return pd.DataFrame()
         
-        # 1. 피벗 테이블 생성
-        pivot_data = []
-        
-        for _, row in curr_summary.iterrows():
-            company = row["회사"]
-            if company == "디앤드디":
-                display_name = "DND"
-            elif company == "디앤아이":
-                display_name = "DNI"
-            else:
-                display_name = company
-            
-            # 기본 데이터
-            pivot_row = {
-                "항목": display_name,
-                "총채권": round(row["총채권"] / 1000000, 0),  # 백만원 단위
-                "총채권 증감(%)": 0.0,  # 기본값
-                "90일 채권 (100만)": round(row["90일초과 매출채권"] / 1000000, 1),
-                "90일 채권 증감(%)": 0.0,  # 기본값
-                "90일 총채권대비(%)": round(row["90일비율"] * 100, 1),
-                "90일 증감(%p)": 0.0,  # 기본값
-                "결제예정일 초과채권 (100만)": round(row["기간초과 매출채권"] / 1000000, 1),
-                "결제예정일 초과채권 증감(%)": 0.0,  # 기본값
-                "결제예정일 총채권대비(%)": round(row["기간초과비율"] * 100, 1),  # 결제예정일 초과 비율
-                "결제예정일 초과증감(%p)": 0.0  # 기본값
-            }
-            
-            # 전주 대비 증감률 계산
-            if prev_summary is not None and not prev_summary.empty:
-                prev_row = prev_summary[prev_summary["회사"] == company]
-                if not prev_row.empty:
-                    prev_data = prev_row.iloc[0]
-                    
-                    # 총채권 증감률 (%)
-                    if prev_data["총채권"] != 0:
-                        change_rate = (row["총채권"] - prev_data["총채권"]) / prev_data["총채권"] * 100
-                        pivot_row["총채권 증감(%)"] = round(change_rate, 1)
-                    
-                    # 90일 채권 증감률 (%)
-                    if prev_data["90일초과 매출채권"] != 0:
-                        change_rate = (row["90일초과 매출채권"] - prev_data["90일초과 매출채권"]) / prev_data["90일초과 매출채권"] * 100
-                        pivot_row["90일 채권 증감(%)"] = round(change_rate, 1)
-                    
-                    # 90일 초과 비율 증감 (%p)
-                    prev_90_ratio = prev_data["90일비율"] * 100
-                    curr_90_ratio = row["90일비율"] * 100
-                    change_90 = curr_90_ratio - prev_90_ratio
-                    pivot_row["90일 증감(%p)"] = round(change_90, 1)
-                    
-                    # 결제예정일 초과채권 증감률 (%)
-                    if prev_data["기간초과 매출채권"] != 0:
-                        change_rate = (row["기간초과 매출채권"] - prev_data["기간초과 매출채권"]) / prev_data["기간초과 매출채권"] * 100
-                        pivot_row["결제예정일 초과채권 증감(%)"] = round(change_rate, 1)
-                    
-                    # 결제예정일 초과 비율 증감 (%p)
-                    prev_overdue_ratio = prev_data["기간초과비율"] * 100
-                    curr_overdue_ratio = row["기간초과비율"] * 100
-                    change_overdue = curr_overdue_ratio - prev_overdue_ratio
-                    pivot_row["결제예정일 초과증감(%p)"] = round(change_overdue, 1)
-            
-            pivot_data.append(pivot_row)
-        
-        pivot_df = pd.DataFrame(pivot_data)
+        # 1. 전주 데이터를 회사 기준으로 한 번에 병합 (전주 행이 없으면 NaN)
+        metrics = ["총채권", "90일초과 매출채권", "기간초과 매출채권", "90일비율", "기간초과비율"]
+        if prev_summary is not None and not prev_summary.empty:
+            prev = prev_summary[["회사"] + metrics]
+        else:
+            prev = pd.DataFrame(columns=["회사"] + metrics)
+        
+        m = curr_summary[["회사"] + metrics].merge(
+            prev, on="회사", how="left", suffixes=("_c", "_p"), validate="one_to_one"
+        )
+        
+        def change_rate(col):
+            """전주 대비 증감률 (%) - 전주 값이 없거나 0이면 0.0"""
+            curr_values = m[f"{col}_c"].to_numpy(dtype="float64")
+            prev_values = m[f"{col}_p"].to_numpy(dtype="float64")
+            return _round_half(_safe_ratio(curr_values - prev_values, prev_values) * 100, 1)
+        
+        def ratio_change(col):
+            """전주 대비 비율 증감 (%p) - 전주 값이 없으면 0.0"""
+            curr_values = m[f"{col}_c"].to_numpy(dtype="float64")
+            prev_values = m[f"{col}_p"].to_numpy(dtype="float64")
+            return _round_half(np.where(np.isnan(prev_values), 0.0, curr_values * 100 - prev_values * 100), 1)
+        
+        # 2. 피벗 테이블 생성 (금액은 백만원 단위, 반올림은 기존과 같이 내장 round() 기준)
+        pivot_df = pd.DataFrame({
+            "항목": m["회사"].map({"디앤드디": "DND", "디앤아이": "DNI"}).fillna(m["회사"]),
+            "총채권": _round_half(m["총채권_c"] / 1000000, 0),
+            "총채권 증감(%)": change_rate("총채권"),
+            "90일 채권 (100만)": _round_half(m["90일초과 매출채권_c"] / 1000000, 1),
+            "90일 채권 증감(%)": change_rate("90일초과 매출채권"),
+            "90일 총채권대비(%)": _round_half(m["90일비율_c"] * 100, 1),
+            "90일 증감(%p)": ratio_change("90일비율"),
+            "결제예정일 초과채권 (100만)": _round_half(m["기간초과 매출채권_c"] / 1000000, 1),
+            "결제예정일 초과채권 증감(%)": change_rate("기간초과 매출채권"),
+            "결제예정일 총채권대비(%)": _round_half(m["기간초과비율_c"] * 100, 1),  # 결제예정일 초과 비율
+            "결제예정일 초과증감(%p)": ratio_change("기간초과비율"),
+        })
         
         return pivot_df
 
@@ -432,7 +505,7 @@ class AccountsReceivableAnalyzer:
             
         # 현재 주 거래처별 집계
         try:
-            curr_agg = curr_df.groupby(client_col, as_index=False).agg({
+            curr_agg = curr_df.groupby(client_col, as_index=False, observed=True).agg({
                 "총채권": "sum",
                 "기간초과 매출채권": "sum"
             })
@@ -448,7 +521,7 @@ class AccountsReceivableAnalyzer:
         # 전주 데이터 처리
         if not prev_df.empty and client_col in prev_df.columns:
             try:
-                prev_agg = prev_df.groupby(client_col, as_index=False).agg({
+                prev_agg = prev_df.groupby(client_col, as_index=False, observed=True).agg({
                     "총채권": "sum",
                     "기간초과 매출채권": "sum"
                 })
@@ -471,75 +544,47 @@ class AccountsReceivableAnalyzer:
             merged["총채권_전주"] = 0
             merged["기간초과_전주"] = 0
 
-        # 비율 및 증감율 계산을 안전하게 수행
-        merged["결제예정일초과비율_금주"] = 0.0
-        merged["결제예정일초과비율_전주"] = 0.0
-        merged["전주대비채권증감율"] = 0.0
-        merged["전주대비결제예정일초과증감율"] = 0.0
-        
-        for idx, row in merged.iterrows():
-            # 결제예정일 초과비율 (현재주, 전주)
-            merged.at[idx, "결제예정일초과비율_금주"] = self.safe_divide(row["기간초과_금주"], row["총채권_금주"]) * 100
-            merged.at[idx, "결제예정일초과비율_전주"] = self.safe_divide(row["기간초과_전주"], row["총채권_전주"]) * 100
-            
-            # 전주 대비 채권 증감율 (%)
-            merged.at[idx, "전주대비채권증감율"] = self.safe_divide(
-                row["총채권_금주"] - row["총채권_전주"], 
-                row["총채권_전주"]
-            ) * 100
-            
-            # 전주 대비 결제예정일 초과비율 증감 (%p) - 비율의 차이
-            merged.at[idx, "전주대비결제예정일초과증감율"] = (
-                merged.at[idx, "결제예정일초과비율_금주"] - merged.at[idx, "결제예정일초과비율_전주"]
-            )
-
-        # 상위 20개 선택
-        top20 = merged.sort_values(by="기간초과_금주", ascending=False).head(20)
-        
-        # 컬럼 선택 및 이름 변경 (백만원 단위로 변환)
-        result = pd.DataFrame()
-        result["거래처명"] = top20["거래처명"]
-        result["총채권(백만)"] = round(top20["총채권_금주"] / 1000000, 1)
-        result["결제예정일초과(백만)"] = round(top20["기간초과_금주"] / 1000000, 1)
-        result["결제예정일초과비율(%)"] = round(top20["결제예정일초과비율_금주"], 1)
-        result["전주대비채권증감율(%)"] = round(top20["전주대비채권증감율"], 1)
-        result["전주대비결제예정일초과증감율(%p)"] = round(top20["전주대비결제예정일초과증감율"], 1)
+        # 상위 20개 선택 (전체 정렬 대신 부분 선택)
+        top20 = merged.nlargest(20, "기간초과_금주")
+        
+        # 비율 및 증감율 계산 - 선택된 20개 행에 대해서만 벡터 연산 (분모가 0이면 0.0)
+        curr_total = top20["총채권_금주"].to_numpy(dtype="float64")
+        prev_total = top20["총채권_전주"].to_numpy(dtype="float64")
+        curr_overdue = top20["기간초과_금주"].to_numpy(dtype="float64")
+        
+        # 결제예정일 초과비율 (현재주, 전주)
+        curr_overdue_ratio = _round_half(_safe_ratio(curr_overdue, curr_total), 4) * 100
+        prev_overdue_ratio = _round_half(_safe_ratio(top20["기간초과_전주"], prev_total), 4) * 100
+        
+        # 전주 대비 채권 증감율 (%)
+        total_change_rate = _round_half(_safe_ratio(curr_total - prev_total, prev_total), 4) * 100
+        
+        # 결과 생성 (백만원 단위로 변환, 전주 대비 결제예정일 초과비율 증감은 %p)
+        # - 마지막 소수 1자리 반올림은 기존에도 Series 단위(numpy) 반올림이었으므로 그대로 유지
+        result = pd.DataFrame({
+            "거래처명": top20["거래처명"].to_numpy(),
+            "총채권(백만)": (curr_total / 1000000).round(1),
+            "결제예정일초과(백만)": (curr_overdue / 1000000).round(1),
+            "결제예정일초과비율(%)": curr_overdue_ratio.round(1),
+            "전주대비채권증감율(%)": total_change_rate.round(1),
+            "전주대비결제예정일초과증감율(%p)": (curr_overdue_ratio - prev_overdue_ratio).round(1),
+        })
         
         return result
 
-    def create_file_info_sheet(self, curr_file_path, prev_file_path):
-        """파일 정보 시트 생성 (월~금 기준)"""
-        from datetime import datetime
-        
+    def create_file_info_sheet(self, curr_ref, prev_ref):
+        """파일 정보 시트 생성 (월~금 기준, FileRef의 날짜/주차분류 사용)"""
         file_info_data = []
         
-        # 현재 주 파일 정보
-        if curr_file_path:
-            curr_filename = Path(curr_file_path).name
-            curr_date = self.extract_date_from_filename(curr_filename)
-            curr_week_label = self.classify_week_by_date(curr_date) if curr_date else "알수없음"
-            
-            file_info_data.append({
-                "구분": "현재 주 (월~금)",
-                "파일명": curr_filename,
-                "추출일": curr_date.strftime("%Y-%m-%d") if curr_date else "알수없음",
-                "주차분류": curr_week_label,
-                "파일경로": str(curr_file_path)
-            })
-        
-        # 전주 파일 정보
-        if prev_file_path:
-            prev_filename = Path(prev_file_path).name
-            prev_date = self.extract_date_from_filename(prev_filename)
-            prev_week_label = self.classify_week_by_date(prev_date) if prev_date else "알수없음"
-            
-            file_info_data.append({
-                "구분": "전주 (월~금)",
-                "파일명": prev_filename,
-                "추출일": prev_date.strftime("%Y-%m-%d") if prev_date else "알수없음",
-                "주차분류": prev_week_label,
-                "파일경로": str(prev_file_path)
-            })
+        for label, file_ref in (("현재 주 (월~금)", curr_ref), ("전주 (월~금)", prev_ref)):
+            if file_ref:
+                file_info_data.append({
+                    "구분": label,
+                    "파일명": file_ref.path.name,
+                    "추출일": file_ref.date.strftime("%Y-%m-%d") if file_ref.date else "알수없음",
+                    "주차분류": file_ref.week_label,
+                    "파일경로": str(file_ref.path)
+                })
         
         # 분석 실행 정보
         file_info_data.append({
@@ -552,35 +597,43 @@ class AccountsReceivableAnalyzer:
         
         return pd.DataFrame(file_info_data)
 
-    def analyze_receivables(self, prev_file_path=None, curr_file_path=None, output_filename="채권_분석_결과.xlsx"):
-        """매출채권 전체 분석 프로세스 (월~금 기준, 리팩토링됨)"""
+    def analyze_receivables(self, prev_file_path=None, curr_file_path=None, output_filename="채권_분석_결과.xlsx",
+                            include_raw=True):
+        """매출채권 전체 분석 프로세스 (월~금 기준, 리팩토링됨)
+        
+        include_raw=False 이면 원본_금주/원본_전주 시트를 저장하지 않음 (분석 시트만 필요한 경우)
+        """
         
         self.logger.info("=== 매출채권 분석 시작 (월~금 기준, 리팩토링됨) ===")
         
-        # 파일 경로 결정
-        if curr_file_path is None or prev_file_path is None:
+        # 파일 결정 (직접 지정된 경로도 FileRef로 변환)
+        curr_ref = self.make_file_ref(curr_file_path) if curr_file_path else None
+        prev_ref = self.make_file_ref(prev_file_path) if prev_file_path else None
+        
+        if curr_ref is None or prev_ref is None:
             self.logger.info("파일 경로가 지정되지 않음. 주간 기준으로 최신 파일 찾는 중... (월~금)")
             auto_curr, auto_prev = self.find_latest_files_by_week()
             
-            if curr_file_path is None:
-                curr_file_path = auto_curr
-            if prev_file_path is None:
-                prev_file_path = auto_prev
+            if curr_ref is None:
+                curr_ref = auto_curr
+            if prev_ref is None:
+                prev_ref = auto_prev
         
-        if curr_file_path:
-            self.logger.info(f"현재 주 파일 (월~금): {curr_file_path}")
-        if prev_file_path:
-            self.logger.info(f"전주 파일 (월~금): {prev_file_path}")
+        if curr_ref:
+            self.logger.info(f"현재 주 파일 (월~금): {curr_ref.path}")
+        if prev_ref:
+            self.logger.info(f"전주 파일 (월~금): {prev_ref.path}")
 
         # 데이터 로드
-        if curr_file_path is None:
+        if curr_ref is None:
             error_msg = "현재 주 파일을 찾을 수 없습니다."
             print(f"  ❌ {error_msg}")
             self.logger.error(error_msg)
             return None
             
-        curr_df = self.read_data(curr_file_path)
-        prev_df = self.read_data(prev_file_path) if prev_file_path else pd.DataFrame()
+        # 원본 시트를 저장할 때만 모든 컬럼을 읽음
+        curr_df = self.read_data(curr_ref.path, all_columns=include_raw)
+        prev_df = self.read_data(prev_ref.path, all_columns=include_raw) if prev_ref else pd.DataFrame()
 
         if curr_df.empty:
             error_msg = "현재 주 데이터가 없습니다."
@@ -603,7 +656,7 @@ class AccountsReceivableAnalyzer:
             top20 = self.make_top20_clients(curr_df, prev_df)
             
             # 파일 정보 시트 생성
-            file_info_sheet = self.create_file_info_sheet(curr_file_path, prev_file_path)
+            file_info_sheet = self.create_file_info_sheet(curr_ref, prev_ref)
 
             # 결과 저장
             output_path = self.config.get_processed_data_dir() / output_filename
@@ -622,9 +675,10 @@ class AccountsReceivableAnalyzer:
                 if not top20.empty:
                     top20.to_excel(writer, sheet_name="TOP20_금주", index=False)
                 
-                curr_df.to_excel(writer, sheet_name="원본_금주", index=False)
-                if not prev_df.empty:
-                    prev_df.to_excel(writer, sheet_name="원본_전주", index=False)
+                if include_raw:
+                    curr_df.to_excel(writer, sheet_name="원본_금주", index=False)
+                    if not prev_df.empty:
+                        prev_df.to_excel(writer, sheet_name="원본_전주", index=False)
                 
             print(f"  💾 결과 저장: {output_filename}")
             self.logger.info(f"채권 분석 결과 저장 완료 (월~금 기준): {output_path}")
@@ -661,8 +715,11 @@ class AccountsReceivableAnalyzer:
             return None
 
 
-def main(prev_file=None, curr_file=None):
-    """메인 실행 함수 (월~금 기준, 리팩토링됨)"""
+def main(prev_file=None, curr_file=None, include_raw=True):
+    """메인 실행 함수 (월~금 기준, 리팩토링됨)
+    
+    include_raw: 원본_금주/원본_전주 시트 저장 여부 (직접 실행 시 --no-raw 로 생략)
+    """
     try:
         analyzer = AccountsReceivableAnalyzer()
         
@@ -672,7 +729,7 @@ def main(prev_file=None, curr_file=None):
         if curr_file and isinstance(curr_file, str):
             curr_file = Path(curr_file) if curr_file != "None" else None
             
-        results = analyzer.analyze_receivables(prev_file, curr_file)
+        results = analyzer.analyze_receivables(prev_file, curr_file, include_raw=include_raw)
         
         if results:
             print("🎉 매출채권 분석 완료! (월~금 기준, 리팩토링됨)")
@@ -689,10 +746,13 @@ def main(prev_file=None, curr_file=None):
 
 
 if __name__ == "__main__":
-    # 직접 실행시 파일 경로 지정 가능
+    # 직접 실행시 파일 경로 지정 가능 (--no-raw: 원본 시트 저장 생략)
     import sys
     
-    prev_file = sys.argv[1] if len(sys.argv) > 1 else None
-    curr_file = sys.argv[2] if len(sys.argv) > 2 else None
+    args = [arg for arg in sys.argv[1:] if arg != "--no-raw"]
+    include_raw = "--no-raw" not in sys.argv[1:]
+    
+    prev_file = args[0] if len(args) > 0 else None
+    curr_file = args[1] if len(args) > 1 else None
     
-    main(prev_file, curr_file)
+    main(prev_file, curr_file, include_raw=include_raw)
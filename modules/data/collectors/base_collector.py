@@ -10,33 +10,175 @@ import shutil
 import calendar
 import re
 import logging
+import threading
+import zipfile
 from selenium import webdriver
 from selenium.webdriver.common.by import By
 from selenium.webdriver.chrome.service import Service
 from selenium.webdriver.chrome.options import Options
 from selenium.webdriver.support.ui import WebDriverWait
 from selenium.webdriver.support import expected_conditions as EC
+from selenium.common.exceptions import TimeoutException
 from datetime import datetime, timedelta
 import pandas as pd
 from pathlib import Path
-import sys
 from abc import ABC, abstractmethod
 from typing import Dict, List, Tuple, Optional
 
-# 경로 설정
-sys.path.append(str(Path(__file__).parent.parent))
-sys.path.append(str(Path(__file__).parent.parent / "validators"))
-
 # 설정 관리자 import
 from modules.utils.config_manager import get_config
 
-# 데이터 검증기 import
+# 엑셀 읽기 엔진 (calamine 또는 openpyxl)
+from modules.utils.excel_engine import EXCEL_ENGINE
+
+# 공유 브라우저 풀
+from modules.data.collectors.browser_pool import browser_pool
+
+# 다운로드 완료 감지용 파일 시스템 이벤트 (watchdog이 없으면 폴링 방식 사용)
 try:
-    from modules.data.validators.sales_data_validator import SalesDataValidator
-    VALIDATOR_AVAILABLE = True
+    from watchdog.observers import Observer
+    from watchdog.events import FileSystemEventHandler
+    WATCHDOG_AVAILABLE = True
 except ImportError:
-    print("⚠️ 매출 데이터 검증기를 찾을 수 없습니다. 검증 기능이 비활성화됩니다.")
-    VALIDATOR_AVAILABLE = False
+    WATCHDOG_AVAILABLE = False
+
+
+def _list_xlsx_names(directory) -> set:
+    """폴더의 xlsx 파일명 집합 (stat 호출 없이 디렉터리 항목만 확인)"""
+    try:
+        with os.scandir(directory) as entries:
+            return {entry.name for entry in entries if entry.name.endswith(".xlsx")}
+    except FileNotFoundError:
+        return set()
+
+
+# 로그인 폼 요소 ID (회사코드, 사용자 ID, 비밀번호, 로그인 버튼) - 한 번의 JS 호출로 함께 조회
+_LOGIN_FIELD_IDS = ("com_code", "id", "passwd", "save")
+_LOGIN_FIELDS_JS = "return [{}];".format(
+    ", ".join(f"document.getElementById('{element_id}')" for element_id in _LOGIN_FIELD_IDS)
+)
+
+# xlsx 시트 XML의 행 태그 (네임스페이스 접두사가 붙은 경우 포함)
+_XML_ROW_RE = re.compile(rb'<(?:\w+:)?row\b')
+
+
+# 다운로드 완료로 볼 최소 파일 크기 - Chrome이 먼저 만드는 0바이트 자리 파일/기록 중인 파일 제외
+_MIN_DOWNLOAD_SIZE = 1000
+
+
+def _download_size(path: Path) -> int:
+    """다운로드 파일 크기 (진행 중인 .crdownload가 있거나 파일이 없으면 0)"""
+    try:
+        if os.path.exists(f"{path}.crdownload"):
+            return 0
+        return os.stat(path).st_size
+    except OSError:
+        return 0
+
+
+def _wait_for_stable_size(path: Path, settle_seconds: float = 7) -> bool:
+    """파일 크기가 최소 크기 이상이고 settle_seconds 동안 변하지 않는지 확인"""
+    initial_size = _download_size(path)
+    if initial_size < _MIN_DOWNLOAD_SIZE:
+        return False
+    time.sleep(settle_seconds)
+    return _download_size(path) == initial_size
+
+
+if WATCHDOG_AVAILABLE:
+    class _DownloadCompleteHandler(FileSystemEventHandler):
+        """Chrome 다운로드 완료 감지 - .crdownload 파일이 .xlsx로 이름 변경되는 시점
+        
+        이름 변경 없이 생성/수정된 파일은 후보로만 기록(needs_settle)하고, 대기 쪽에서 크기 안정화를 확인
+        """
+        
+        def __init__(self, existing_files: Optional[set] = None):
+            super().__init__()
+            self.completed = threading.Event()
+            self.file_path = None
+            self.needs_settle = False
+            self.existing_files = existing_files or set()
+        
+        def _complete(self, path: str, renamed: bool):
+            if (not path.endswith(".xlsx") or os.path.basename(path) in self.existing_files
+                    or self.completed.is_set()):
+                return
+            # 0바이트 자리 파일이나 아직 기록 중인 작은 파일은 무시
+            if _download_size(Path(path)) < _MIN_DOWNLOAD_SIZE:
+                return
+            self.file_path = Path(path)
+            self.needs_settle = not renamed
+            self.completed.set()
+        
+        def on_moved(self, event):
+            if not event.is_directory:
+                self._complete(os.fsdecode(event.dest_path), renamed=True)
+        
+        def on_created(self, event):
+            if not event.is_directory:
+                self._complete(os.fsdecode(event.src_path), renamed=False)
+        
+        def on_modified(self, event):
+            # 자리 파일에 내용이 직접 기록되는 경우
+            if not event.is_directory:
+                self._complete(os.fsdecode(event.src_path), renamed=False)
+
+
+def _read_excel_file(file_path: str) -> pd.DataFrame:
+    """엑셀 파일 읽기 (calamine이 있으면 한 번에, 없으면 단계별 시도)"""
+    
+    # calamine은 stylesheet를 해석하지 않으므로 한 번의 읽기로 충분
+    if EXCEL_ENGINE == "calamine":
+        try:
+            df = pd.read_excel(file_path, engine="calamine")
+        except Exception as e:
+            print(f"   ❌ calamine 읽기 실패: {str(e)[:50]}...")
+            raise Exception(f"Excel 파일 읽기 실패: {str(e)}")
+        print(f"   ✅ calamine 읽기 성공: {len(df)}행, {len(df.columns)}열")
+        return df
+    
+    # calamine이 없는 환경 - 1차 시도: pandas 기본 (빠른 확인)
+    try:
+        df = pd.read_excel(file_path)
+        print(f"   ✅ pandas 직접 읽기 성공: {len(df)}행, {len(df.columns)}열")
+        return df
+    except Exception as e:
+        error_str = str(e).lower()
+        if 'stylesheet' in error_str:
+            print(f"   🔧 stylesheet 오류 감지 - CSV 변환 모드로 전환")
+        else:
+            print(f"   ⚠️ pandas 실패: {str(e)[:50]}... - CSV 변환 시도")
+    
+    # 2차 시도: openpyxl로 데이터만 읽기 (스타일 무시)
+    try:
+        import openpyxl
+        print(f"   🔧 openpyxl 데이터만 읽기 시도...")
+        
+        wb = openpyxl.load_workbook(file_path, data_only=True)
+        ws = wb.active
+        
+        # 모든 데이터 추출
+        data = []
+        for row in ws.iter_rows(values_only=True):
+            if any(cell is not None for cell in row):
+                data.append(row)
+        
+        wb.close()
+        
+        if data and len(data) > 1:
+            df = pd.DataFrame(data[1:], columns=data[0])
+            print(f"   ✅ openpyxl 읽기 성공: {len(df)}행, {len(df.columns)}열")
+            return df
+        else:
+            raise Exception("추출된 데이터 없음")
+            
+    except Exception as e:
+        last_error = e
+        print(f"   ❌ openpyxl 실패: {str(e)[:50]}...")
+    
+    # 3차 시도: 최소한의 읽기
+    print(f"   ❌ 모든 읽기 방법 실패")
+    raise Exception(f"Excel 파일 읽기 실패: {str(last_error)}")
 
 
 class BaseDataCollector(ABC):
@@ -46,9 +188,23 @@ class BaseDataCollector(ABC):
         self.config = get_config()
         self.selenium_config = self.config.get_selenium_config()
         
-        # 헤드리스 모드 강제 비활성화 (항상 브라우저 표시)
-        self.selenium_config['headless'] = False
-        print(f"👀 브라우저 모드: 항상 표시 (헤드리스 모드 비활성화)")
+        # 헤드리스 모드: 인자 > 환경변수 HEADLESS ("1"/"0") > 설정 파일 (기본: 브라우저 표시)
+        # - GUI는 수집 과정을 보고 개입할 수 있도록 브라우저를 표시하고, 일괄/CLI 실행만 헤드리스 사용
+        if headless_mode is not None:
+            self.selenium_config['headless'] = headless_mode
+        elif os.environ.get("HEADLESS") is not None:
+            self.selenium_config['headless'] = os.environ["HEADLESS"] == "1"
+        else:
+            self.selenium_config.setdefault('headless', False)
+        
+    def load_validator(self):
+        """매출 데이터 검증기 생성 (검증기 모듈은 처음 필요할 때만 import, 없으면 None)"""
+        try:
+            from modules.data.validators.sales_data_validator import SalesDataValidator
+        except ImportError:
+            print("⚠️ 매출 데이터 검증기를 찾을 수 없습니다. 검증 기능이 비활성화됩니다.")
+            return None
+        return SalesDataValidator()
         
     def js_click(self, driver, element):
         """JavaScript를 이용한 안전한 클릭"""
@@ -57,11 +213,19 @@ class BaseDataCollector(ABC):
         driver.execute_script("arguments[0].click();", element)
 
     def launch_driver(self):
-        """Chrome 드라이버 실행 - 항상 브라우저 표시 모드"""
+        """Chrome 드라이버 실행 - 헤드리스/브라우저 표시 모드"""
         chrome_options = Options()
+        headless = self.selenium_config.get('headless', False)
         
-        # 항상 브라우저 표시 모드
-        print(f"👀 브라우저 모드: 항상 표시 (헤드리스 모드 비활성화)")
+        if headless:
+            # 화면을 그리지 않는 헤드리스 모드 (예약/일괄 실행용)
+            chrome_options.add_argument("--headless=new")
+            chrome_options.add_argument("--disable-gpu")
+            window_size = self.selenium_config.get("window_size", "1920,1080")
+            chrome_options.add_argument(f"--window-size={window_size}")
+            print(f"🔇 브라우저 모드: 헤드리스")
+        else:
+            print(f"👀 브라우저 모드: 표시")
         
         # 다운로드 경로 설정
         paths = self.config.get_paths()
@@ -71,6 +235,16 @@ class BaseDataCollector(ABC):
             "download.prompt_for_download": False,
             "download.directory_upgrade": True
         }
+        
+        # 다운로드 전용 수집 시 이미지/알림 로딩 생략 (설정에서 켠 경우만, CSS는 선택자 동작을 위해 유지)
+        if self.selenium_config.get("disable_images", False):
+            prefs.update({
+                "profile.managed_default_content_settings.images": 2,
+                "profile.default_content_setting_values.notifications": 2,
+            })
+            chrome_options.add_argument("--blink-settings=imagesEnabled=false")
+            print(f"🖼️ 이미지 로딩 비활성화")
+        
         chrome_options.add_experimental_option("prefs", prefs)
         print(f"📁 다운로드 경로 설정: {download_path}")
         
@@ -90,9 +264,10 @@ class BaseDataCollector(ABC):
         
         driver = webdriver.Chrome(service=Service(), options=chrome_options)
         
-        # 브라우저 최대화 (무조건 실행)
-        driver.maximize_window()
-        print(f"🖥️ 브라우저 창 최대화 완료")
+        # 브라우저 최대화 (표시 모드에서만 - 헤드리스는 창 크기 인자로 지정)
+        if not headless:
+            driver.maximize_window()
+            print(f"🖥️ 브라우저 창 최대화 완료")
         
         # 대기 시간 설정
         driver.implicitly_wait(self.selenium_config.get("implicit_wait", 10))
@@ -100,22 +275,80 @@ class BaseDataCollector(ABC):
         
         return driver
 
+    def acquire_driver(self):
+        """공유 풀에서 드라이버 획득 (없거나 종료된 경우에만 launch_driver로 새로 실행)"""
+        return browser_pool.acquire_driver(self.launch_driver)
+
+    def release_driver(self, driver):
+        """공유 풀에 드라이버 반환 (브라우저는 drain_pool() 호출 시 종료)"""
+        browser_pool.release_driver(driver)
+
+    @staticmethod
+    def _login_key(account):
+        """로그인 세션 식별 키 (회사코드, 사용자 ID)"""
+        return (account.get("company_code"), account.get("user_id"))
+
+    def order_accounts_by_session(self, accounts):
+        """공유 브라우저에 이미 로그인된 계정을 맨 앞으로 - 이전 수집기의 마지막 계정 로그인을 그대로 재사용
+        
+        (매출 A, B → 매출채권 B, A 순서가 되어 수집 1회당 로그인 1번 절약)
+        """
+        login_key = browser_pool.current_login_key()
+        if login_key is None:
+            return list(accounts)
+        return sorted(accounts, key=lambda account: self._login_key(account) != login_key)
+
+    def _has_login_session(self, driver, account) -> bool:
+        """공유 드라이버가 같은 계정 (회사코드, 사용자 ID)으로 로그인된 상태인지 확인"""
+        if browser_pool.logged_in_account(driver) != self._login_key(account):
+            return False
+        try:
+            current_url = driver.current_url
+        except Exception:
+            return False
+        return "ecount.com" in current_url and "login.ecount.com" not in current_url
+
+    def _clear_login_session(self, driver):
+        """재사용할 수 없는 이전 세션(쿠키, localStorage/sessionStorage) 정리
+
+        기록된 계정이 요청한 계정과 다르거나, 기록이 없는 경우(이전 로그인 결과를 모르는 경우 포함) 항상 호출
+        """
+        try:
+            driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+        except Exception:
+            try:
+                driver.delete_all_cookies()
+            except Exception as e:
+                print(f"   ⚠️ 이전 세션 쿠키 정리 실패: {e}")
+        try:
+            # 현재 페이지(이전 세션의 ERP 페이지) 저장소 정리 - about:blank 등 저장소가 없는 페이지는 무시
+            driver.execute_script(
+                "try { window.localStorage.clear(); window.sessionStorage.clear(); } catch (e) {}"
+            )
+        except Exception as e:
+            print(f"   ⚠️ 이전 세션 저장소 정리 실패: {e}")
+        browser_pool.set_logged_in_account(driver, None)
+
     def basic_login(self, driver, account):
         """기본 로그인 처리 - 브라우저 표시 모드"""
         wait = WebDriverWait(driver, self.selenium_config.get("implicit_wait", 10))
         company_name = account.get("company_name", "")
         
+        # 같은 계정으로 로그인된 공유 브라우저 세션이 살아있으면 로그인 생략
+        if self._has_login_session(driver, account):
+            print(f"   ♻️ {company_name} 기존 로그인 세션 재사용")
+            return True
+        
+        # 재사용할 수 없는 세션(다른 계정, 결과를 모르는 이전 로그인)은 항상 정리 후 로그인
+        self._clear_login_session(driver)
+        
         print(f"   🔐 {company_name} 로그인 시작...")
         
         # 1. 로그인 페이지로 이동
         driver.get('https://login.ecount.com/Login')
         print(f"   🌐 로그인 페이지 로드 완료")
         
-        # 2. 페이지 로딩 대기 (브라우저 모드에 최적화)
-        print(f"   ⏳ 페이지 로딩 대기 (3초)...")
-        time.sleep(3)
-        
-        # DOM 준비 상태 확인
+        # 2. DOM 준비 상태 확인 (고정 대기 없이 준비되는 즉시 진행)
         try:
             WebDriverWait(driver, 10).until(
                 lambda d: d.execute_script("return document.readyState") == "complete"
@@ -125,40 +358,48 @@ class BaseDataCollector(ABC):
             print(f"   ⚠️ DOM 대기 타임아웃 - 계속 진행")
         
         try:
-            # 3. 요소 대기 타임아웃 설정
-            timeout = 10  # 브라우저 모드에 최적화된 타임아웃
-            print(f"   🔍 요소 대기 타임아웃: {timeout}초")
+            # 3. 로그인 폼 준비 대기 후 필드/버튼을 한 번의 JS 호출로 가져옴 (요소마다 왕복 요청하지 않음)
+            wait.until(EC.element_to_be_clickable((By.ID, "com_code")))
+            com_code_field, id_field, passwd_field, login_button = driver.execute_script(_LOGIN_FIELDS_JS)
+            if not all((com_code_field, id_field, passwd_field, login_button)):
+                # 폼이 부분적으로만 렌더링된 경우 요소별로 대기
+                com_code_field, id_field, passwd_field, login_button = (
+                    wait.until(EC.element_to_be_clickable((By.ID, element_id)))
+                    for element_id in _LOGIN_FIELD_IDS
+                )
             
-            # 로그인 필드 입력 (순차적으로)
+            # 로그인 필드 입력
             print(f"   📝 회사코드 입력: {account['company_code']}")
-            com_code_field = wait.until(EC.presence_of_element_located((By.ID, "com_code")))
             com_code_field.clear()
             com_code_field.send_keys(account["company_code"])
-            time.sleep(1)  # 브라우저 모드 최적화
             
             print(f"   📝 사용자 ID 입력: {account['user_id']}")
-            id_field = WebDriverWait(driver, timeout).until(EC.presence_of_element_located((By.ID, "id")))
             id_field.clear()
             id_field.send_keys(account["user_id"])
-            time.sleep(1)
             
             print(f"   📝 비밀번호 입력")
-            passwd_field = WebDriverWait(driver, timeout).until(EC.presence_of_element_located((By.ID, "passwd")))
             passwd_field.clear()
             passwd_field.send_keys(account["user_pw"])
-            time.sleep(1)  # 브라우저 모드 최적화
             
             # 4. 로그인 버튼 클릭
             print(f"로그인 버튼 클릭")
-            login_button = WebDriverWait(driver, timeout).until(EC.element_to_be_clickable((By.ID, "save")))
             
             # 브라우저 모드에서는 일반 클릭 사용
             login_button.click()
             
-            # 5. 로그인 처리 대기
-            wait_time = 10  # 브라우저 모드 최적화
-            print(f"   ⏳ 로그인 처리 대기 ({wait_time}초)...")
-            time.sleep(wait_time)
+            # 5. 로그인 처리 대기 - 로그인 페이지를 벗어나거나 오류 메시지가 표시될 때까지
+            #    (find_elements는 implicit wait만큼 대기하므로 오류 확인은 JS로 즉시 수행)
+            wait_time = 15
+            print(f"   ⏳ 로그인 처리 대기 (최대 {wait_time}초)...")
+            try:
+                WebDriverWait(driver, wait_time).until(
+                    lambda d: "login.ecount.com" not in d.current_url or d.execute_script(
+                        "return Array.from(document.getElementsByClassName('error'))"
+                        ".some(e => e.offsetParent !== null && e.textContent.trim() !== '');"
+                    )
+                )
+            except TimeoutException:
+                print(f"   ⚠️ 로그인 처리 대기 타임아웃 - 현재 상태로 확인")
             
             # 6. 로그인 성공 확인
             current_url = driver.current_url
@@ -181,6 +422,7 @@ class BaseDataCollector(ABC):
                 
             elif "ecount.com" in current_url:
                 print(f"   ✅ {company_name} 로그인 성공!")
+                browser_pool.set_logged_in_account(driver, self._login_key(account))
                 return True
             else:
                 print(f"   🤔 {company_name} 로그인 상태 불명 - URL: {current_url}")
@@ -189,12 +431,17 @@ class BaseDataCollector(ABC):
         except Exception as e:
             print(f"   ❌ {company_name} 로그인 중 오류: {e}")
             return False
-        
-        # 7. 추가 안정화 대기
-        time.sleep(3)  # 브라우저 모드 최적화
 
-    def wait_for_download(self, company_name: str, target_filename: str, download_timeout: int = None) -> Optional[Path]:
-        """개선된 다운로드 대기 및 파일 처리 - Excel 유효성 검증 포함"""
+    def snapshot_downloads(self) -> set:
+        """다운로드 시작 전 다운로드 폴더의 xlsx 파일명 목록 (wait_for_download가 새 파일만 확인하도록)"""
+        return _list_xlsx_names(self.config.get_downloads_dir())
+
+    def wait_for_download(self, company_name: str, target_filename: str, download_timeout: int = None,
+                          existing_files: Optional[set] = None) -> Optional[Path]:
+        """개선된 다운로드 대기 및 파일 처리 - Excel 유효성 검증 포함
+        
+        existing_files: 다운로드 버튼 클릭 전에 snapshot_downloads()로 기록한 파일명 목록 (있으면 그 외 파일만 확인)
+        """
         if download_timeout is None:
             download_timeout = self.config.get_download_timeout()
             
@@ -203,39 +450,91 @@ class BaseDataCollector(ABC):
         
         start_time = time.time()
         
+        if WATCHDOG_AVAILABLE:
+            latest_file = self._wait_for_download_event(download_path, download_timeout, start_time, existing_files)
+        else:
+            latest_file = self._poll_for_download(download_path, download_timeout, start_time, existing_files)
+        
+        if latest_file is None:
+            print(f"   ⏰ 다운로드 timeout ({download_timeout}초 초과)")
+            return None
+        
+        # Excel 파일 유효성 검증 (손상된 파일도 반환하여 복구 시도)
+        print(f"   📊 Excel 파일 발견: {latest_file.name} ({latest_file.stat().st_size:,} bytes)")
+        
+        # 검증 시도하지만 실패해도 파일은 반환 (복구 가능성)
+        is_valid = self.validate_excel_file(latest_file)
+        if is_valid:
+            print(f"   ✅ 유효한 Excel 파일 확인")
+        else:
+            print(f"   ⚠️ Excel 파일 검증 실패 - 복구 시도 예정")
+        
+        return latest_file
+
+    def _wait_for_download_event(self, download_path: Path, download_timeout: int, start_time: float,
+                                 existing_files: Optional[set] = None) -> Optional[Path]:
+        """파일 시스템 이벤트로 다운로드 완료 대기 (Chrome의 .crdownload → .xlsx 이름 변경 감지)"""
+        handler = _DownloadCompleteHandler(existing_files)
+        observer = Observer()
+        observer.schedule(handler, str(download_path), recursive=False)
+        observer.start()
+        
+        try:
+            # 감시 시작 전에 이미 끝난 다운로드 확인 (최소 크기 이상이고 크기가 안정된 파일만)
+            if existing_files is not None:
+                # 클릭 전 목록에 없던 파일만
+                recent_files = [
+                    download_path / name for name in _list_xlsx_names(download_path) - existing_files
+                    if _download_size(download_path / name) >= _MIN_DOWNLOAD_SIZE
+                ]
+            else:
+                # 엑셀 버튼 클릭 직후 호출되므로 직전 몇 초 이내 파일만
+                recent_files = [
+                    path for path in download_path.glob("*.xlsx")
+                    if path.stat().st_mtime >= start_time - 5 and _download_size(path) >= _MIN_DOWNLOAD_SIZE
+                ]
+            if recent_files:
+                latest_file = max(recent_files, key=lambda x: x.stat().st_mtime)
+                if _wait_for_stable_size(latest_file):
+                    return latest_file
+            
+            remaining = download_timeout - (time.time() - start_time)
+            if not handler.completed.wait(timeout=max(remaining, 0)):
+                return None
+            
+            # .crdownload 이름 변경으로 완료된 파일은 바로 사용, 그 외에는 크기가 안정될 때까지 확인
+            file_path = handler.file_path
+            if not handler.needs_settle:
+                return file_path
+            while time.time() - start_time < download_timeout:
+                if _wait_for_stable_size(file_path):
+                    return file_path
+                time.sleep(1)
+            return None
+        finally:
+            observer.stop()
+            observer.join()
+
+    def _poll_for_download(self, download_path: Path, download_timeout: int, start_time: float,
+                           existing_files: Optional[set] = None) -> Optional[Path]:
+        """폴링 방식 다운로드 대기 (watchdog이 설치되지 않은 경우)"""
         while time.time() - start_time < download_timeout:
             time.sleep(1)
             
-            # 개선된 파일 찾기 로직
-            xlsx_files = list(download_path.glob("*.xlsx"))
+            # 개선된 파일 찾기 로직 - 클릭 전 목록이 있으면 새로 생긴 파일만 stat
+            if existing_files is not None:
+                xlsx_files = [download_path / name for name in _list_xlsx_names(download_path) - existing_files]
+            else:
+                xlsx_files = list(download_path.glob("*.xlsx"))
             
             if xlsx_files:
                 # 최신 파일 찾기 (생성 시간 기준)
                 latest_file = max(xlsx_files, key=lambda x: x.stat().st_ctime)
                 
-                # 파일 안정성 확인 (크기가 변하지 않는지)
-                initial_size = latest_file.stat().st_size
-                if initial_size < 1000:  # 1KB 미만이면 아직 다운로드 중
-                    continue
-                    
-                # 안정화 대기 (다운로드 완료 보장을 위해 5초 추가)
-                time.sleep(7)
-                current_size = latest_file.stat().st_size
-                
-                if current_size == initial_size and current_size > 1000:
-                    # Excel 파일 유효성 검증 (손상된 파일도 반환하여 복구 시도)
-                    print(f"   📊 Excel 파일 발견: {latest_file.name} ({current_size:,} bytes)")
-                    
-                    # 검증 시도하지만 실패해도 파일은 반환 (복구 가능성)
-                    is_valid = self.validate_excel_file(latest_file)
-                    if is_valid:
-                        print(f"   ✅ 유효한 Excel 파일 확인")
-                    else:
-                        print(f"   ⚠️ Excel 파일 검증 실패 - 복구 시도 예정")
-                    
+                # 파일 안정성 확인 (1KB 미만이면 아직 다운로드 중, 이상이면 크기가 변하지 않는지 대기 후 확인)
+                if _wait_for_stable_size(latest_file):
                     return latest_file
-                        
-        print(f"   ⏰ 다운로드 timeout ({download_timeout}초 초과)")
+        
         return None
     
     def validate_excel_file(self, file_path: Path) -> bool:
@@ -253,98 +552,60 @@ class BaseDataCollector(ABC):
             else:
                 print(f"   ✅ 파일 크기 정상: {file_size:,} bytes")
             
-            # 1차 시도: pandas 기본 읽기
-            try:
-                df = pd.read_excel(file_path, nrows=5)
-                if not df.empty and df.shape[1] > 0:
-                    print(f"   ✅ pandas 읽기 성공: {len(df)}행, {df.shape[1]}열")
-                    return True
-            except Exception as e:
-                error_str = str(e).lower()
-                if 'stylesheet' in error_str:
-                    print(f"   🔧 stylesheet 오류 감지 - 대안 방법 시도")
-                else:
-                    print(f"   ⚠️ pandas 실패: {str(e)[:50]}...")
-            
-            # 2차 시도: openpyxl로 데이터만 읽기 (스타일 무시)
+            # 1차 시도: xlsx(zip) 구조 검사 - 모든 항목의 CRC를 확인한 뒤 첫 시트 XML 앞부분만 읽어 행 수 확인
+            #          (스타일/공유문자열 파싱 없음)
             try:
-                import openpyxl
-                wb = openpyxl.load_workbook(file_path, data_only=True, read_only=True)
-                ws = wb.active
-                
-                # 첫 5행만 확인
-                row_count = 0
-                for row in ws.iter_rows(max_row=5, values_only=True):
-                    if any(cell is not None for cell in row):
-                        row_count += 1
-                
-                wb.close()
+                with zipfile.ZipFile(file_path) as zf:
+                    bad_member = zf.testzip()
+                    if bad_member is not None:
+                        print(f"   ❌ 손상된 xlsx: {bad_member} CRC 불일치")
+                        return False
+                    
+                    names = set(zf.namelist())
+                    if "[Content_Types].xml" not in names:
+                        print(f"   ❌ xlsx 구조 오류: [Content_Types].xml 없음")
+                        return False
+                    
+                    sheet_name = "xl/worksheets/sheet1.xml"
+                    if sheet_name not in names:
+                        sheets = sorted(n for n in names if n.startswith("xl/worksheets/") and n.endswith(".xml"))
+                        if not sheets:
+                            print(f"   ❌ xlsx 구조 오류: 워크시트 없음")
+                            return False
+                        sheet_name = sheets[0]
+                    
+                    with zf.open(sheet_name) as sheet_xml:
+                        chunk = sheet_xml.read(8192)
                 
+                row_count = len(_XML_ROW_RE.findall(chunk))
                 if row_count >= 2:  # 헤더 + 최소 1행 데이터
-                    print(f"   ✅ openpyxl 검증 성공: {row_count}행")
+                    print(f"   ✅ xlsx 구조 검증 성공: {row_count}행 이상")
                     return True
-                else:
-                    print(f"   ❌ 유효 데이터 부족: {row_count}행")
-                    
-            except Exception as e:
-                print(f"   ❌ openpyxl 검증 실패: {str(e)[:50]}...")
-            
-            # 3차 시도: 파일 크기만으로 판단 (대용량 파일은 보통 정상)
-            if file_size > 1024 * 1024:  # 1MB 이상이면 OK
-                print(f"   ⚠️ 검증 실패하지만 파일 크기로 판단: OK ({file_size:,} bytes)")
-                return True
-            else:
-                print(f"   ❌ 모든 검증 방법 실패")
+                print(f"   ❌ 유효 데이터 부족: {row_count}행")
+                
+            except zipfile.BadZipFile as e:
+                # zip이 아니거나 손상된 파일은 다른 방법으로도 읽을 수 없음
+                print(f"   ❌ 손상된 xlsx: {str(e)[:50]}")
                 return False
+            
+            return self._validate_by_file_size(file_size)
                 
         except Exception as e:
             print(f"   ❌ 검증 중 오류: {e}")
             return False
 
+    def _validate_by_file_size(self, file_size: int) -> bool:
+        """마지막 판단: 파일 크기 (대용량 파일은 보통 정상)"""
+        if file_size > 1024 * 1024:  # 1MB 이상이면 OK
+            print(f"   ⚠️ 검증 실패하지만 파일 크기로 판단: OK ({file_size:,} bytes)")
+            return True
+        else:
+            print(f"   ❌ 모든 검증 방법 실패")
+            return False
+
     def read_excel_via_csv(self, file_path: Path):
         """Excel→CSV 변환 후 읽기 - stylesheet 오류 완전 우회"""
-        
-        # 1차 시도: pandas 기본 (빠른 확인)
-        try:
-            df = pd.read_excel(file_path)
-            print(f"   ✅ pandas 직접 읽기 성공: {len(df)}행, {len(df.columns)}열")
-            return df
-        except Exception as e:
-            error_str = str(e).lower()
-            if 'stylesheet' in error_str:
-                print(f"   🔧 stylesheet 오류 감지 - CSV 변환 모드로 전환")
-            else:
-                print(f"   ⚠️ pandas 실패: {str(e)[:50]}... - CSV 변환 시도")
-        
-        # 2차 시도: openpyxl로 데이터만 읽기 (스타일 무시)
-        try:
-            import openpyxl
-            print(f"   🔧 openpyxl 데이터만 읽기 시도...")
-            
-            wb = openpyxl.load_workbook(file_path, data_only=True)
-            ws = wb.active
-            
-            # 모든 데이터 추출
-            data = []
-            for row in ws.iter_rows(values_only=True):
-                if any(cell is not None for cell in row):
-                    data.append(row)
-            
-            wb.close()
-            
-            if data and len(data) > 1:
-                df = pd.DataFrame(data[1:], columns=data[0])
-                print(f"   ✅ openpyxl 읽기 성공: {len(df)}행, {len(df.columns)}열")
-                return df
-            else:
-                raise Exception("추출된 데이터 없음")
-                
-        except Exception as e:
-            print(f"   ❌ openpyxl 실패: {str(e)[:50]}...")
-        
-        # 3차 시도: 최소한의 읽기
-        print(f"   ❌ 모든 읽기 방법 실패")
-        raise Exception(f"Excel 파일 읽기 실패: {str(e)}")
+        return _read_excel_file(str(file_path))
 
     def set_headless_mode(self, headless: bool = True):
         """헤드리스 모드 설정"""
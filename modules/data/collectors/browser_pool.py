@@ -0,0 +1,182 @@
+"""
+공유 Chrome 드라이버 풀
+수집기/계정마다 Chrome을 새로 띄우지 않고 하나의 드라이버를 재사용
+(브라우저 하나를 여러 작업이 동시에 조작할 수 없으므로 한 번에 한 쓰레드만 드라이버를 사용)
+"""
+
+import atexit
+import logging
+import threading
+from contextlib import contextmanager
+
+logger = logging.getLogger('BrowserPool')
+
+
+class BrowserPool:
+    """배타적 대여 방식의 Chrome 드라이버 풀 (프로세스당 드라이버 1개)"""
+
+    def __init__(self):
+        self._cond = threading.Condition()
+        self._driver = None
+        self._owner = None           # 드라이버를 사용 중인 쓰레드 ID
+        self._depth = 0              # 같은 쓰레드의 중첩 획득 횟수
+        self._waiters = 0            # 드라이버 반환을 기다리는 쓰레드 수
+        self._drain_pending = False  # 사용 중에 요청된 종료 - 마지막 반환 시 처리
+        self._logged_in_account = None  # 현재 드라이버에 로그인된 계정 (회사코드, 사용자 ID)
+
+    @staticmethod
+    def _is_alive(driver) -> bool:
+        """드라이버 상태 확인 - chromedriver 프로세스와 브라우저 세션이 모두 살아있는지"""
+        try:
+            process = getattr(driver.service, "process", None)
+            if process is not None and process.poll() is not None:
+                return False
+            driver.current_url  # 가벼운 세션 확인 요청
+            return True
+        except Exception:
+            return False
+
+    @staticmethod
+    def _quit(driver):
+        try:
+            driver.quit()
+        except Exception as e:
+            logger.debug(f"브라우저 종료 중 오류 무시: {e}")
+
+    def _discard_locked(self):
+        """현재 드라이버 폐기 (lock을 잡은 상태에서 호출, 종료는 호출자가 lock 밖에서)"""
+        driver = self._driver
+        self._driver = None
+        self._logged_in_account = None
+        self._drain_pending = False
+        return driver
+
+    def _release_ownership_locked(self):
+        """사용권 반환 (lock을 잡은 상태에서 호출) - 종료 대기 중이었다면 폐기할 드라이버 반환"""
+        self._depth -= 1
+        if self._depth > 0:
+            return None
+        self._owner = None
+        to_quit = None
+        if self._drain_pending and self._waiters == 0:
+            to_quit = self._discard_locked()
+        self._cond.notify()
+        return to_quit
+
+    def acquire_driver(self, launcher):
+        """드라이버 획득 - 다른 쓰레드가 사용 중이면 반환될 때까지 대기, 살아있는 드라이버는 재사용
+
+        Args:
+            launcher: 드라이버가 없을 때 호출할 실행 함수 (예: BaseDataCollector.launch_driver)
+        """
+        me = threading.get_ident()
+        with self._cond:
+            if self._owner == me:
+                self._depth += 1
+                return self._driver
+
+            self._waiters += 1
+            try:
+                while self._owner is not None:
+                    self._cond.wait()
+            finally:
+                self._waiters -= 1
+            self._owner = me
+            self._depth = 1
+            # 다시 사용하려는 작업이 있으므로 보류 중이던 종료 요청은 취소
+            self._drain_pending = False
+            driver = self._driver
+
+        # 사용권을 가진 상태이므로 상태 확인/실행은 lock 밖에서 (응답 없는 브라우저가 다른 대기자를 막지 않도록)
+        try:
+            if driver is not None and not self._is_alive(driver):
+                logger.warning("공유 브라우저가 응답하지 않아 다시 실행합니다.")
+                with self._cond:
+                    if self._driver is driver:
+                        self._discard_locked()
+                self._quit(driver)
+                driver = None
+
+            if driver is None:
+                driver = launcher()
+                with self._cond:
+                    self._driver = driver
+                    self._logged_in_account = None
+            return driver
+        except BaseException:
+            with self._cond:
+                to_quit = self._release_ownership_locked()
+            if to_quit is not None:
+                self._quit(to_quit)
+            raise
+
+    def release_driver(self, driver):
+        """드라이버 반환 - 로그인 세션은 유지해 같은 계정의 다음 작업이 재사용"""
+        to_quit = []
+        with self._cond:
+            if self._owner == threading.get_ident():
+                discarded = self._release_ownership_locked()
+                if discarded is not None:
+                    to_quit.append(discarded)
+            if driver is not None and driver is not self._driver and driver not in to_quit:
+                # 이미 폐기/교체된 드라이버는 바로 종료
+                to_quit.append(driver)
+
+        for stale in to_quit:
+            self._quit(stale)
+            if stale is not driver:
+                logger.info("공유 브라우저 종료 (보류된 종료 요청 처리)")
+
+    def logged_in_account(self, driver):
+        """드라이버에 로그인된 계정 키 (회사코드, 사용자 ID) - 모르면 None"""
+        with self._cond:
+            return self._logged_in_account if driver is self._driver else None
+
+    def current_login_key(self):
+        """공유 드라이버에 현재 로그인된 계정 키 (드라이버가 없거나 모르면 None)"""
+        with self._cond:
+            return self._logged_in_account if self._driver is not None else None
+
+    def set_logged_in_account(self, driver, login_key):
+        """로그인 성공/세션 정리 시 현재 로그인된 계정 키 (회사코드, 사용자 ID) 기록"""
+        with self._cond:
+            if driver is self._driver:
+                self._logged_in_account = login_key
+
+    @contextmanager
+    def acquire(self, launcher):
+        """with 문용 드라이버 획득/반환"""
+        driver = self.acquire_driver(launcher)
+        try:
+            yield driver
+        finally:
+            self.release_driver(driver)
+
+    def drain(self, force=False):
+        """작업 종료 시 공유 드라이버 정리
+
+        다른 작업이 드라이버를 사용 중이거나 기다리고 있으면 종료를 미루고 마지막 반환 시 종료.
+        force=True 이면 사용 중이어도 즉시 종료 (프로그램 종료 시)
+        """
+        with self._cond:
+            if not force and (self._owner is not None or self._waiters):
+                self._drain_pending = True
+                logger.debug("공유 브라우저 사용 중 - 반환 후 종료")
+                return
+            driver = self._discard_locked()
+
+        if driver is not None:
+            self._quit(driver)
+            logger.info("공유 브라우저 종료")
+
+
+# 프로세스 전역 풀
+browser_pool = BrowserPool()
+
+
+def drain_pool(force=False):
+    """공유 브라우저 종료 (수집 작업 종료 시 호출, 사용 중이면 반환 후 종료)"""
+    browser_pool.drain(force=force)
+
+
+atexit.register(drain_pool, force=True)
@@ -5,19 +5,33 @@
 """
 
 import pandas as pd
+import os
+import re
+import html
+import zipfile
 from pathlib import Path
 import logging
+from itertools import chain, repeat
 from openpyxl import load_workbook
+from openpyxl.utils.cell import get_column_letter, range_boundaries
 import shutil
 from datetime import datetime
-import sys
 
-# 리팩토링된 경로 설정
-sys.path.append(str(Path(__file__).parent.parent.parent))
+from modules.data.processors.workbook_session import workbook_sessions
 
 # 설정 관리자 import (새 구조)
 from modules.utils.config_manager import get_config
 
+# xl/workbook.xml의 <sheet name="..."> 항목 (네임스페이스 접두어가 붙은 경우 포함)
+_SHEET_NAME_RE = re.compile(r'<(?:\w+:)?sheet\b[^>]*?\sname="([^"]*)"')
+
+
+def read_sheet_names(xlsx_path):
+    """xlsx의 시트 이름 목록 - workbook.xml 항목만 읽어 워크북 전체를 파싱하지 않음"""
+    with zipfile.ZipFile(xlsx_path) as z:
+        xml = z.read("xl/workbook.xml").decode("utf-8")
+    return [html.unescape(name) for name in _SHEET_NAME_RE.findall(xml)]
+
 
 class ReceivablesDataCopier:
     """매출채권 데이터 자동 복사기 (리팩토링됨)"""
@@ -59,41 +73,80 @@ class ReceivablesDataCopier:
             }
         }
     
-    def copy_sheet_data_with_offset(self, source_sheet, target_sheet, config):
-        """소스 시트에서 타겟 시트로 데이터 복사 (오프셋 적용)"""
-        source_range = config["source_range"] 
-        target_start_row, target_start_col = config["target_start"]
+    def read_source_block(self, source_sheet, config):
+        """소스 범위를 행별 값 튜플 목록으로 읽기
+        
+        읽기 전용 시트는 데이터가 끝나면 행을 더 돌려주지 않으므로, 범위의 나머지 행/열은
+        None으로 채워 템플릿에 남아있던 이전 값이 지워지도록 함
+        """
+        min_col, min_row, max_col, max_row = range_boundaries(config["source_range"])
+        width = max_col - min_col + 1
+        height = max_row - min_row + 1
         
-        self.logger.info(f"📋 복사 설정: {source_range} → ({target_start_row}, {target_start_col})")
+        source_rows = source_sheet.iter_rows(
+            min_row=min_row, max_row=max_row, min_col=min_col, max_col=max_col, values_only=True)
+        rows = [
+            tuple(row_values) + (None,) * (width - len(row_values))
+            for _, row_values in zip(range(height), chain(source_rows, repeat(())))
+        ]
         
-        # 소스 범위 파싱
-        start_cell, end_cell = source_range.split(':')
+        # 디버깅: 읽은 소스 데이터 확인 (DEBUG 레벨이 켜진 경우에만 메시지 생성)
+        if self.logger.isEnabledFor(logging.DEBUG):
+            self.logger.debug(f"📋 소스 데이터 읽기 완료: {len(rows)}행")
+            for i, row_values in enumerate(rows):
+                self.logger.debug(f"  소스 행 {i}: {row_values[:3]}... (처음 3개 셀만)")
         
-        # 소스 데이터 읽기
-        source_data = []
-        for row in source_sheet[source_range]:
-            row_data = []
-            for cell in row:
-                # None 값 처리
-                value = cell.value if cell.value is not None else ""
-                row_data.append(value)
-            source_data.append(row_data)
+        return rows
+    
+    def write_block(self, target_sheet, rows, config):
+        """읽어둔 값 목록을 타겟 시트의 시작 위치부터 쓰기"""
+        target_start_row, target_start_col = config["target_start"]
+        debug_enabled = self.logger.isEnabledFor(logging.DEBUG)
         
-        # 디버깅: 읽은 소스 데이터 확인
-        self.logger.info(f"📋 소스 데이터 읽기 완료: {len(source_data)}행")
-        for i, row_data in enumerate(source_data):
-            self.logger.info(f"  소스 행 {i}: {row_data[:3]}... (처음 3개 셀만)")
+        self.logger.info(f"📋 복사 설정: {config['source_range']} → ({target_start_row}, {target_start_col})")
         
-        # 타겟에 데이터 쓰기
-        for row_idx, row_data in enumerate(source_data):
+        if not rows:
+            self.logger.info("✅ 복사 완료: 0행 x 0열")
+            return
+        
+        # 행 단위 범위로 셀을 한 번에 가져와 값만 지정 (셀마다 좌표를 해석하는 .cell() 호출 회피)
+        start_col_letter = get_column_letter(target_start_col)
+        end_col_letter = get_column_letter(target_start_col + len(rows[0]) - 1)
+        
+        for row_idx, row_values in enumerate(rows):
             target_row = target_start_row + row_idx
-            self.logger.info(f"📝 행 {row_idx} 복사: {row_data[:3]}... → 타겟 행 {target_row}")
+            if debug_enabled:
+                self.logger.debug(f"📝 행 {row_idx} 복사: {row_values[:3]}... → 타겟 행 {target_row}")
             
-            for col_idx, value in enumerate(row_data):
-                target_col = target_start_col + col_idx
-                target_sheet.cell(row=target_row, column=target_col, value=value)
+            (target_cells,) = target_sheet[f"{start_col_letter}{target_row}:{end_col_letter}{target_row}"]
+            for cell, value in zip(target_cells, row_values):
+                # None 값은 빈 문자열로 기록
+                cell.value = value if value is not None else ""
+        
+        self.logger.info(f"✅ 복사 완료: {len(rows)}행 x {len(rows[0])}열")
+    
+    def copy_sheet_data_with_offset(self, source_sheet, target_sheet, config):
+        """소스 시트에서 타겟 시트로 데이터 복사 (오프셋 적용)"""
+        self.write_block(target_sheet, self.read_source_block(source_sheet, config), config)
+    
+    def _read_source_blocks(self, source_sheet_names):
+        """소스 파일을 한 번만 열어(읽기 전용) 시트별 범위를 순서대로 읽기
         
-        self.logger.info(f"✅ 복사 완료: {len(source_data)}행 x {len(source_data[0]) if source_data else 0}열")
+        Returns:
+            {시트명: 행 목록} - 읽기에 실패한 시트는 예외 객체
+        """
+        blocks = {}
+        source_wb = load_workbook(str(self.receivables_file), read_only=True, data_only=True, keep_links=False)
+        try:
+            for source_sheet_name in source_sheet_names:
+                try:
+                    blocks[source_sheet_name] = self.read_source_block(
+                        source_wb[source_sheet_name], self.copy_configs[source_sheet_name])
+                except Exception as e:
+                    blocks[source_sheet_name] = e
+        finally:
+            source_wb.close()
+        return blocks
     
     def copy_receivables_to_template(self, target_file_path):
         """매출채권 데이터를 지정된 파일에 복사"""
@@ -111,43 +164,46 @@ class ReceivablesDataCopier:
                 self.logger.error(f"대상 파일이 없습니다: {target_path}")
                 return False
             
-            # 워크북 열기
-            source_wb = load_workbook(str(self.receivables_file))
-            target_wb = load_workbook(str(target_path))
+            # 소스 시트 확인 (workbook.xml에서 시트 목록만 확인)
+            source_sheetnames = set(read_sheet_names(self.receivables_file))
             
-            # 각 시트 복사
-            copied_sheets = 0
+            source_sheets = []
+            for source_sheet_name in self.sheet_mapping:
+                if source_sheet_name in source_sheetnames:
+                    source_sheets.append(source_sheet_name)
+                else:
+                    self.logger.warning(f"소스 시트가 없습니다: {source_sheet_name}")
             
-            for source_sheet_name, target_sheet_name in self.sheet_mapping.items():
-                try:
-                    # 소스 시트 확인
-                    if source_sheet_name not in source_wb.sheetnames:
-                        self.logger.warning(f"소스 시트가 없습니다: {source_sheet_name}")
-                        continue
-                    
-                    # 타겟 시트 확인
-                    if target_sheet_name not in target_wb.sheetnames:
-                        self.logger.warning(f"타겟 시트가 없습니다: {target_sheet_name}")
-                        continue
-                    
-                    # 시트 데이터 복사
-                    self.copy_sheet_data_with_offset(
-                        source_wb[source_sheet_name],
-                        target_wb[target_sheet_name],
-                        self.copy_configs[source_sheet_name]
-                    )
-                    
-                    copied_sheets += 1
-                    self.logger.info(f"✅ {source_sheet_name} → {target_sheet_name} 복사 완료")
-                    
-                except Exception as e:
-                    self.logger.error(f"❌ {source_sheet_name} 복사 실패: {e}")
-                    continue
+            # 소스 범위를 먼저 모두 읽어 둔 뒤 타겟에 쓰기
+            # 타겟 워크북은 공유 세션에서 가져오며, 가장 바깥 세션이 끝날 때 한 번만 저장됨
+            source_blocks = self._read_source_blocks(source_sheets)
             
-            # 대상 파일 저장
-            target_wb.save(str(target_path))
-            source_wb.close()
-            target_wb.close()
+            with workbook_sessions.session(target_path):
+                target_wb = workbook_sessions.get(target_path)
+                
+                # 각 시트 복사
+                copied_sheets = 0
+                
+                for source_sheet_name in source_sheets:
+                    target_sheet_name = self.sheet_mapping[source_sheet_name]
+                    try:
+                        # 타겟 시트 확인
+                        if target_sheet_name not in target_wb.sheetnames:
+                            self.logger.warning(f"타겟 시트가 없습니다: {target_sheet_name}")
+                            continue
+                        
+                        # 시트 데이터 복사
+                        rows = source_blocks[source_sheet_name]
+                        if isinstance(rows, Exception):
+                            raise rows
+                        self.write_block(target_wb[target_sheet_name], rows, self.copy_configs[source_sheet_name])
+                        
+                        copied_sheets += 1
+                        self.logger.info(f"✅ {source_sheet_name} → {target_sheet_name} 복사 완료")
+                        
+                    except Exception as e:
+                        self.logger.error(f"❌ {source_sheet_name} 복사 실패: {e}")
+                        continue
             
             self.logger.info(f"=== 매출채권 데이터 복사 완료: {copied_sheets}개 시트 ===")
             return copied_sheets > 0
@@ -156,21 +212,46 @@ class ReceivablesDataCopier:
             self.logger.error(f"매출채권 데이터 복사 중 전체 오류: {e}")
             return False
     
+    def _create_backup_link(self, source_path: Path, backup_path: Path):
+        """백업 생성 - 가능하면 하드링크(데이터 복사 없음), 불가능하면 복사
+        
+        보고서는 워크북 세션이 임시 파일 저장 후 교체하므로 하드링크 백업은 이전 내용을 유지함
+        """
+        try:
+            os.link(source_path, backup_path)
+        except OSError:
+            # 다른 파일 시스템이거나 하드링크를 지원하지 않는 경우
+            shutil.copy2(source_path, backup_path)
+    
     def copy_to_report(self, report_file_path, create_backup=True):
         """보고서 파일에 매출채권 데이터 복사 (백업 포함)"""
         try:
             report_path = Path(report_file_path)
             
             # 백업 생성
+            backup_path = None
             if create_backup and report_path.exists():
                 backup_path = report_path.with_name(
                     f"{report_path.stem}_backup_{datetime.now().strftime('%Y%m%d_%H%M%S')}{report_path.suffix}"
                 )
-                shutil.copy2(report_path, backup_path)
+                self._create_backup_link(report_path, backup_path)
                 self.logger.info(f"백업 생성됨: {backup_path.name}")
             
-            # 매출채권 데이터 복사
-            result = self.copy_receivables_to_template(report_path)
+            def release_backup(saved):
+                """세션 저장이 끝난 뒤 호출 - 보고서가 교체되지 않았다면 백업 제거
+                
+                저장이 실패하거나 건너뛴 경우 하드링크 백업은 원본과 같은 파일이므로 남겨두면
+                이후 보고서를 제자리 수정할 때 백업 내용도 함께 바뀜
+                """
+                if saved or backup_path is None or not backup_path.exists():
+                    return
+                backup_path.unlink()
+                self.logger.info(f"보고서 변경 없음 - 백업 제거: {backup_path.name}")
+            
+            # 매출채권 데이터 복사 (같은 보고서를 수정 중인 세션이 있으면 워크북 로드/저장을 공유)
+            # - 백업 정리는 실제 저장(가장 바깥 세션 종료)이 끝난 뒤 수행
+            with workbook_sessions.session(report_path, on_close=release_backup):
+                result = self.copy_receivables_to_template(report_path)
             
             if result:
                 print(f"  💾 매출채권 데이터 복사 완료: {report_path.name}")
@@ -195,17 +276,15 @@ class ReceivablesDataCopier:
                 self.logger.warning(f"매출채권 중간파일이 없습니다: {self.receivables_file}")
                 return False, "매출채권 분석 결과 파일이 없습니다."
             
-            # 파일 읽기 시도
-            wb = load_workbook(str(self.receivables_file))
+            # 시트 목록만 필요하므로 workbook.xml 항목만 읽음
+            sheetnames = set(read_sheet_names(self.receivables_file))
             
             # 필요한 시트 존재 확인
             missing_sheets = []
             for sheet_name in self.sheet_mapping.keys():
-                if sheet_name not in wb.sheetnames:
+                if sheet_name not in sheetnames:
                     missing_sheets.append(sheet_name)
             
-            wb.close()
-            
             if missing_sheets:
                 missing_msg = f"필요한 시트가 없습니다: {', '.join(missing_sheets)}"
                 self.logger.warning(missing_msg)
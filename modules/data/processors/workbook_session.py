@@ -0,0 +1,110 @@
+"""
+공유 보고서 워크북 세션
+보고서 생성기와 복사기가 같은 보고서 파일을 수정할 때 워크북을 한 번만 로드하고, 가장 바깥 세션 종료 시 한 번만 저장
+"""
+
+import logging
+import os
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+
+from openpyxl import load_workbook
+
+logger = logging.getLogger('WorkbookSession')
+
+
+class _SessionEntry:
+    """경로별 세션 상태"""
+
+    def __init__(self):
+        self.workbook = None
+        self.ref_count = 0
+        self.on_close = []  # 가장 바깥 세션 종료 후 호출할 함수 (인자: 저장 여부)
+
+
+class WorkbookSessionManager:
+    """참조 카운트 기반 워크북 세션 관리자 (경로당 워크북 1개, 세션이 끝나면 해제)"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entries = {}
+
+    @staticmethod
+    def _key(path) -> str:
+        return os.path.normcase(str(Path(path).resolve()))
+
+    @staticmethod
+    def _save_atomic(workbook, path: Path):
+        """임시 파일에 저장한 뒤 교체 - 기존 파일(하드링크 백업 포함)의 내용은 건드리지 않음"""
+        tmp_path = path.with_name(f"~{path.stem}.tmp{path.suffix}")
+        try:
+            workbook.save(str(tmp_path))
+            os.replace(tmp_path, path)
+        except BaseException:
+            if tmp_path.exists():
+                tmp_path.unlink()
+            raise
+
+    @contextmanager
+    def session(self, path, on_close=None):
+        """with 문용 세션 - 중첩 가능, 가장 바깥 세션이 정상 종료되면 로드된 워크북을 한 번 저장
+
+        Args:
+            on_close: 가장 바깥 세션 종료(저장 시도) 후 호출할 함수 - 인자는 저장 성공 여부.
+                      세션이 중첩돼 있어도 실제 저장이 끝난 뒤에 호출됨
+        """
+        key = self._key(path)
+        with self._lock:
+            entry = self._entries.setdefault(key, _SessionEntry())
+            entry.ref_count += 1
+            if on_close is not None:
+                entry.on_close.append(on_close)
+
+        failed = False
+        try:
+            yield
+        except BaseException:
+            failed = True
+            raise
+        finally:
+            with self._lock:
+                entry.ref_count -= 1
+                outermost = entry.ref_count == 0
+                if outermost:
+                    del self._entries[key]
+            if outermost:
+                self._finish(entry, Path(path), save=not failed)
+
+    def _finish(self, entry, path: Path, save: bool):
+        """가장 바깥 세션 종료 처리 - 저장 후 워크북 해제, 등록된 종료 함수 호출"""
+        saved = False
+        try:
+            if save and entry.workbook is not None:
+                self._save_atomic(entry.workbook, path)
+                saved = True
+                logger.debug(f"세션 워크북 저장: {path.name}")
+        finally:
+            entry.workbook = None
+            for callback in entry.on_close:
+                try:
+                    callback(saved)
+                except Exception as e:
+                    logger.error(f"워크북 세션 종료 처리 오류: {e}")
+
+    def get(self, path):
+        """세션 안에서 공유 워크북 반환 - 세션에서 처음 요청할 때 로드"""
+        key = self._key(path)
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is None:
+            raise RuntimeError(f"열린 워크북 세션이 없습니다: {path}")
+
+        if entry.workbook is None:
+            entry.workbook = load_workbook(str(path))
+            logger.debug(f"세션 워크북 로드: {Path(path).name}")
+        return entry.workbook
+
+
+# 프로세스 전역 세션 관리자
+workbook_sessions = WorkbookSessionManager()
@@ -26,14 +26,8 @@ from modules.utils.config_manager import get_config
 
 # BaseDataCollector import (새 구조)
 from modules.data.collectors.base_collector import BaseDataCollector
+from modules.data.collectors.browser_pool import drain_pool
 
-# 데이터 검증기 import (새 구조)
-try:
-    from modules.data.validators.sales_data_validator import SalesDataValidator
-    VALIDATOR_AVAILABLE = True
-except ImportError:
-    print("⚠️ 매출 데이터 검증기를 찾을 수 없습니다. 검증 기능이 비활성화됩니다.")
-    VALIDATOR_AVAILABLE = False
 
 class SalesDataCollector(BaseDataCollector):
     """매출 데이터 수집 클래스 - 백업본의 작동하는 로직 사용 (리팩토링됨)"""
@@ -42,14 +36,13 @@ class SalesDataCollector(BaseDataCollector):
         super().__init__(headless_mode)
         self.accounts = self.config.get_accounts()
         
-        # 데이터 검증기 초기화
-        if VALIDATOR_AVAILABLE:
-            self.validator = SalesDataValidator()
-            self.logger = logging.getLogger('SalesDataCollector')
+        self.logger = logging.getLogger('SalesDataCollector')
+        
+        # 데이터 검증기 초기화 (검증기 모듈은 여기서 처음 import)
+        self.validator = self.load_validator()
+        if self.validator is not None:
             print("✅ 매출 데이터 검증기 활성화")
         else:
-            self.validator = None
-            self.logger = logging.getLogger('SalesDataCollector')
             print("⚠️ 매출 데이터 검증기 비활성화")
         
     def get_target_accounts(self) -> List[Dict[str, str]]:
@@ -417,14 +410,15 @@ class SalesDataCollector(BaseDataCollector):
         try:
             print(f"   📊 {company_name} 엑셀 다운로드 시작...")
             
-            # 엑셀 버튼 클릭
+            # 엑셀 버튼 클릭 (클릭 전 다운로드 폴더 상태를 기록해 새 파일만 확인)
             wait = WebDriverWait(driver, 10)
             excel_button = wait.until(EC.element_to_be_clickable((By.CSS_SELECTOR, "div#footer_toolbar_toolbar_item_excel button")))
+            existing_files = self.snapshot_downloads()
             self.js_click(driver, excel_button)
             
             # 다운로드 대기
             filename = f"{company_name}_매출_조회_{start_date}_{end_date}.xlsx"
-            downloaded_file = self.wait_for_download(company_name, filename)
+            downloaded_file = self.wait_for_download(company_name, filename, existing_files=existing_files)
             
             if downloaded_file:
                 # 저장 경로로 이동
@@ -447,7 +441,8 @@ class SalesDataCollector(BaseDataCollector):
         print("🚀 매출 데이터 수집 시작 (리팩토링됨)")
         
         date_ranges = self.generate_monthly_date_ranges(num_months, start_date, end_date)
-        accounts = self.get_target_accounts()
+        # 공유 브라우저에 로그인된 계정부터 수집 (로그인 재사용)
+        accounts = self.order_accounts_by_session(self.get_target_accounts())
         
         total_tasks = len(accounts) * len(date_ranges)
         current_task = 0
@@ -458,7 +453,7 @@ class SalesDataCollector(BaseDataCollector):
             
             driver = None
             try:
-                driver = self.launch_driver()
+                driver = self.acquire_driver()
                 
                 # 로그인
                 if not self.basic_login(driver, account):
@@ -495,8 +490,9 @@ class SalesDataCollector(BaseDataCollector):
                 
             finally:
                 if driver:
-                    driver.quit()
-                    print(f"🔌 {company_name} 브라우저 종료")
+                    # 브라우저는 종료하지 않고 다음 계정/수집기가 재사용
+                    self.release_driver(driver)
+                    print(f"🔌 {company_name} 브라우저 반환")
         
         print(f"\n🎉 매출 데이터 수집 완료 (리팩토링됨)")
 
@@ -553,14 +549,15 @@ class ReceivablesDataCollector(BaseDataCollector):
         try:
             print(f"   📊 {company_name} 매출채권 엑셀 다운로드 시작...")
             
-            # 엑셀 버튼 클릭
+            # 엑셀 버튼 클릭 (클릭 전 다운로드 폴더 상태를 기록해 새 파일만 확인)
             wait = WebDriverWait(driver, 10)
             excel_button = wait.until(EC.element_to_be_clickable((By.CSS_SELECTOR, "div#footer_toolbar_toolbar_item_excel button")))
+            existing_files = self.snapshot_downloads()
             self.js_click(driver, excel_button)
             
             # 다운로드 대기
             filename = f"{company_name}_매출채권_{target_date}.xlsx"
-            downloaded_file = self.wait_for_download(company_name, filename)
+            downloaded_file = self.wait_for_download(company_name, filename, existing_files=existing_files)
             
             if downloaded_file:
                 # 저장 경로로 이동
@@ -587,7 +584,8 @@ class ReceivablesDataCollector(BaseDataCollector):
         friday_date = self.get_friday_date(target_date)
         print(f"📅 수집 기준일: {friday_date} (금요일)")
         
-        accounts = self.get_target_accounts()
+        # 공유 브라우저에 로그인된 계정부터 수집 (로그인 재사용)
+        accounts = self.order_accounts_by_session(self.get_target_accounts())
         total_tasks = len(accounts)
         current_task = 0
         
@@ -603,7 +601,7 @@ class ReceivablesDataCollector(BaseDataCollector):
                     progress = (current_task / total_tasks) * 100
                     progress_callback(f"{company_name} 매출채권 수집 중", progress)
                 
-                driver = self.launch_driver()
+                driver = self.acquire_driver()
                 
                 # 로그인
                 if not self.basic_login(driver, account):
@@ -627,8 +625,9 @@ class ReceivablesDataCollector(BaseDataCollector):
                 
             finally:
                 if driver:
-                    driver.quit()
-                    print(f"🔌 {company_name} 브라우저 종료")
+                    # 브라우저는 종료하지 않고 다음 계정/수집기가 재사용
+                    self.release_driver(driver)
+                    print(f"🔌 {company_name} 브라우저 반환")
         
         print(f"\n🎉 매출채권 데이터 수집 완료 (금요일 기준, 리팩토링됨)")
 
@@ -687,6 +686,9 @@ class UnifiedDataCollector:
                 print(f"❌ 매출채권 데이터 수집 실패: {e}")
                 success_results['receivables'] = False
         
+        # 매출/매출채권 수집기가 공유한 브라우저 종료
+        drain_pool()
+        
         # 결과 요약
         print(f"\n📋 수집 결과 요약 (월~금 기준, 리팩토링됨):")
         for data_type, success in success_results.items():
@@ -736,6 +738,8 @@ class UnifiedDataCollector:
             import traceback
             traceback.print_exc()
             return False
+        finally:
+            drain_pool()
 
 # 이전 버전과의 호환성을 위한 클래스 별칭
 DataCollector = SalesDataCollector
@@ -17,7 +17,6 @@ import logging
 from datetime import datetime
 import shutil
 import math
-from openpyxl import load_workbook
 from openpyxl.utils.dataframe import dataframe_to_rows
 from openpyxl.utils import get_column_letter
 from openpyxl.cell import MergedCell
@@ -40,6 +39,11 @@ except ImportError:
             ReceivablesDataCopier = None
             print("ReceivablesDataCopier를 찾을 수 없습니다. 매출채권 복사 기능이 비활성화됩니다.")
 
+try:
+    from ..data.processors.workbook_session import workbook_sessions
+except ImportError:
+    from modules.data.processors.workbook_session import workbook_sessions
+
 warnings.filterwarnings('ignore', category=UserWarning, module='openpyxl')
 
 
@@ -506,42 +510,40 @@ class StandardFormatReportGenerator:
             monthly_data, weekly_data = self.load_sales_data()
             summary_data, calculation_data = self.load_receivables_data()
             
-            # Excel 워크북 열기
-            wb = load_workbook(str(self.result_path))
-            
-            # B1, D1 셀 설정 (옵셔널)
-            if base_month or start_date_range:
-                self.set_report_headers(wb, base_month, start_date_range)
-            
-            # 매출집계 데이터(raw) 시트 작성
-            if monthly_data is not None or weekly_data is not None:
-                self.write_sales_raw_sheet_safe(wb, monthly_data, weekly_data)
-            
-            # 매출채권요약 시트 작성 (비활성화 - receivables_data_copier에서 처리)
-            # if summary_data is not None or calculation_data is not None:
-            #     self.write_receivables_summary_sheet_safe(wb, summary_data, calculation_data)
-            
-            # 저장
-            wb.save(str(self.result_path))
-            wb.close()
-            
-            # 매출채권 데이터 자동 복사 추가
-            self.logger.info("=== 매출채권 데이터 자동 복사 시작 ===")
-            try:
-                if ReceivablesDataCopier is not None:
-                    copier = ReceivablesDataCopier()
-                    copy_success = copier.copy_receivables_to_template(str(self.result_path))
-                    
-                    if copy_success:
-                        self.logger.info("✅ 매출채권 데이터 자동 복사 완료")
+            # Excel 워크북 열기 - 매출채권 복사기와 같은 세션을 사용해 로드/저장을 한 번씩만 수행
+            # (세션이 끝날 때 저장)
+            with workbook_sessions.session(self.result_path):
+                wb = workbook_sessions.get(self.result_path)
+                
+                # B1, D1 셀 설정 (옵셔널)
+                if base_month or start_date_range:
+                    self.set_report_headers(wb, base_month, start_date_range)
+                
+                # 매출집계 데이터(raw) 시트 작성
+                if monthly_data is not None or weekly_data is not None:
+                    self.write_sales_raw_sheet_safe(wb, monthly_data, weekly_data)
+                
+                # 매출채권요약 시트 작성 (비활성화 - receivables_data_copier에서 처리)
+                # if summary_data is not None or calculation_data is not None:
+                #     self.write_receivables_summary_sheet_safe(wb, summary_data, calculation_data)
+                
+                # 매출채권 데이터 자동 복사 추가
+                self.logger.info("=== 매출채권 데이터 자동 복사 시작 ===")
+                try:
+                    if ReceivablesDataCopier is not None:
+                        copier = ReceivablesDataCopier()
+                        copy_success = copier.copy_receivables_to_template(str(self.result_path))
+                        
+                        if copy_success:
+                            self.logger.info("✅ 매출채권 데이터 자동 복사 완료")
+                        else:
+                            self.logger.warning("⚠️ 매출채권 데이터 복사 실패, 하지만 매출 데이터는 정상 생성")
                     else:
-                        self.logger.warning("⚠️ 매출채권 데이터 복사 실패, 하지만 매출 데이터는 정상 생성")
-                else:
-                    self.logger.warning("⚠️ ReceivablesDataCopier를 사용할 수 없습니다")
-                    
-            except Exception as e:
-                self.logger.error(f"매출채권 데이터 복사 중 오류: {e}")
-                self.logger.warning("⚠️ 매출채권 데이터 없이 보고서 생성 완료")
+                        self.logger.warning("⚠️ ReceivablesDataCopier를 사용할 수 없습니다")
+                        
+                except Exception as e:
+                    self.logger.error(f"매출채권 데이터 복사 중 오류: {e}")
+                    self.logger.warning("⚠️ 매출채권 데이터 없이 보고서 생성 완료")
             
             self.logger.info("=== 표준 양식 호환 보고서 생성 완료 ===")
             return True
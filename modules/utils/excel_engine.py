@@ -0,0 +1,20 @@
+"""
+엑셀 읽기 엔진 선택
+python-calamine(Rust 기반, pandas 2.2+)이 있으면 사용하고 없으면 openpyxl 사용
+"""
+
+import pandas as pd
+
+
+def detect_excel_engine():
+    """엑셀 읽기 엔진 선택 - python-calamine(pandas 2.2+)이 있으면 사용, 없으면 openpyxl"""
+    try:
+        import python_calamine  # noqa: F401
+    except ImportError:
+        return "openpyxl"
+    
+    major, minor = (int(part) for part in pd.__version__.split(".")[:2])
+    return "calamine" if (major, minor) >= (2, 2) else "openpyxl"
+
+
+EXCEL_ENGINE = detect_excel_engine()
@@ -0,0 +1,156 @@
+"""
+매출채권 요약/TOP20 반올림 회귀 테스트
+벡터화된 계산이 기존 행 단위 계산(내장 round())과 같은 값을 내는지 경계값(x.x5) 비율로 확인
+"""
+
+import sys
+from pathlib import Path
+
+import pandas as pd
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from modules.core.accounts_receivable_analyzer import AccountsReceivableAnalyzer
+
+
+def _baseline_divide(numerator, denominator, decimals=4):
+    """기존 safe_divide와 같은 계산"""
+    if denominator == 0 or pd.isna(denominator) or pd.isna(numerator):
+        return 0.0
+    return round(float(numerator) / float(denominator), decimals)
+
+
+def _baseline_summary(df):
+    """기존 summarize_receivables의 행 단위 계산"""
+    summary = df.groupby("회사").agg({
+        "총채권": "sum",
+        "90일초과 매출채권": "sum",
+        "기간초과 매출채권": "sum"
+    }).reset_index()
+    total_row = pd.DataFrame({
+        "회사": ["합계"],
+        "총채권": [summary["총채권"].sum()],
+        "90일초과 매출채권": [summary["90일초과 매출채권"].sum()],
+        "기간초과 매출채권": [summary["기간초과 매출채권"].sum()]
+    })
+    final = pd.concat([summary, total_row], ignore_index=True)
+    final["90일비율"] = 0.0
+    final["기간초과비율"] = 0.0
+    for idx, row in final.iterrows():
+        final.at[idx, "90일비율"] = _baseline_divide(row["90일초과 매출채권"], row["총채권"])
+        final.at[idx, "기간초과비율"] = _baseline_divide(row["기간초과 매출채권"], row["총채권"])
+    return final
+
+
+def _baseline_pivot(curr_summary, prev_summary):
+    """기존 make_summary_pivot의 행 단위 계산"""
+    names = {"디앤드디": "DND", "디앤아이": "DNI"}
+    rows = []
+    for _, row in curr_summary.iterrows():
+        company = row["회사"]
+        pivot_row = {
+            "항목": names.get(company, company),
+            "총채권": round(row["총채권"] / 1000000, 0),
+            "총채권 증감(%)": 0.0,
+            "90일 채권 (100만)": round(row["90일초과 매출채권"] / 1000000, 1),
+            "90일 채권 증감(%)": 0.0,
+            "90일 총채권대비(%)": round(row["90일비율"] * 100, 1),
+            "90일 증감(%p)": 0.0,
+            "결제예정일 초과채권 (100만)": round(row["기간초과 매출채권"] / 1000000, 1),
+            "결제예정일 초과채권 증감(%)": 0.0,
+            "결제예정일 총채권대비(%)": round(row["기간초과비율"] * 100, 1),
+            "결제예정일 초과증감(%p)": 0.0,
+        }
+        prev_row = prev_summary[prev_summary["회사"] == company]
+        if not prev_row.empty:
+            prev = prev_row.iloc[0]
+            for col, key in (("총채권", "총채권 증감(%)"),
+                             ("90일초과 매출채권", "90일 채권 증감(%)"),
+                             ("기간초과 매출채권", "결제예정일 초과채권 증감(%)")):
+                if prev[col] != 0:
+                    pivot_row[key] = round((row[col] - prev[col]) / prev[col] * 100, 1)
+            pivot_row["90일 증감(%p)"] = round(row["90일비율"] * 100 - prev["90일비율"] * 100, 1)
+            pivot_row["결제예정일 초과증감(%p)"] = round(row["기간초과비율"] * 100 - prev["기간초과비율"] * 100, 1)
+        rows.append(pivot_row)
+    return pd.DataFrame(rows)
+
+
+def _baseline_top20(curr_df, prev_df):
+    """기존 make_top20_clients의 행 단위 계산"""
+    curr_agg = curr_df.groupby("거래처명", as_index=False).agg({"총채권": "sum", "기간초과 매출채권": "sum"})
+    curr_agg = curr_agg.rename(columns={"총채권": "총채권_금주", "기간초과 매출채권": "기간초과_금주"})
+    prev_agg = prev_df.groupby("거래처명", as_index=False).agg({"총채권": "sum", "기간초과 매출채권": "sum"})
+    prev_agg = prev_agg.rename(columns={"총채권": "총채권_전주", "기간초과 매출채권": "기간초과_전주"})
+    merged = curr_agg.merge(prev_agg, on="거래처명", how="left").fillna(0)
+
+    rows = []
+    for _, row in merged.iterrows():
+        curr_ratio = _baseline_divide(row["기간초과_금주"], row["총채권_금주"]) * 100
+        prev_ratio = _baseline_divide(row["기간초과_전주"], row["총채권_전주"]) * 100
+        rows.append({
+            "거래처명": row["거래처명"],
+            "기간초과_금주": row["기간초과_금주"],
+            "총채권_금주": row["총채권_금주"],
+            "비율": curr_ratio,
+            "증감율": _baseline_divide(row["총채권_금주"] - row["총채권_전주"], row["총채권_전주"]) * 100,
+            "증감": curr_ratio - prev_ratio,
+        })
+    top20 = pd.DataFrame(rows).sort_values(by="기간초과_금주", ascending=False).head(20)
+
+    result = pd.DataFrame()
+    result["거래처명"] = top20["거래처명"]
+    result["총채권(백만)"] = round(top20["총채권_금주"] / 1000000, 1)
+    result["결제예정일초과(백만)"] = round(top20["기간초과_금주"] / 1000000, 1)
+    result["결제예정일초과비율(%)"] = round(top20["비율"], 1)
+    result["전주대비채권증감율(%)"] = round(top20["증감율"], 1)
+    result["전주대비결제예정일초과증감율(%p)"] = round(top20["증감"], 1)
+    return result.reset_index(drop=True)
+
+
+def _frame(rows):
+    """(회사, 거래처명, 총채권, 90일초과, 기간초과) 목록으로 원본 DataFrame 생성"""
+    return pd.DataFrame([
+        {"회사": company, "거래처코드": str(1000 + i), "거래처명": client,
+         "총채권": float(total), "90일초과 매출채권": float(over90), "기간초과 매출채권": float(overdue)}
+        for i, (company, client, total, over90, overdue) in enumerate(rows)
+    ])
+
+
+# 비율 * 100 이 x.x5 부근이 되는 값 (numpy 짝수 반올림과 내장 round() 결과가 갈리는 경계)
+CURR_ROWS = [
+    ("디앤드디", "거래처A", 20_000_000, 2_010_000, 1_250_000),
+    ("디앤드디", "거래처B", 2_000_000, 0, 2_010),
+    ("디앤아이", "거래처C", 10_000_000, 1_005_000, 3_125_000),
+    ("디앤아이", "거래처D", 8_000_000, 804_000, 0),
+]
+PREV_ROWS = [
+    ("디앤드디", "거래처A", 19_900_000, 1_990_000, 1_245_000),
+    ("디앤드디", "거래처B", 1_990_000, 0, 0),
+    ("디앤아이", "거래처C", 10_050_000, 1_000_000, 3_000_000),
+    ("디앤아이", "거래처D", 8_000_000, 800_000, 10_050),
+]
+
+
+@pytest.fixture
+def analyzer():
+    return AccountsReceivableAnalyzer()
+
+
+def test_summary_pivot_matches_row_rounding(analyzer):
+    curr_df, prev_df = _frame(CURR_ROWS), _frame(PREV_ROWS)
+
+    pivot = analyzer.make_summary_pivot(analyzer.summarize_receivables(curr_df.copy()),
+                                        analyzer.summarize_receivables(prev_df.copy()))
+    expected = _baseline_pivot(_baseline_summary(curr_df), _baseline_summary(prev_df))
+
+    pd.testing.assert_frame_equal(pivot.reset_index(drop=True), expected, check_dtype=False)
+
+
+def test_top20_matches_row_rounding(analyzer):
+    curr_df, prev_df = _frame(CURR_ROWS), _frame(PREV_ROWS)
+
+    top20 = analyzer.make_top20_clients(curr_df, prev_df)
+    expected = _baseline_top20(curr_df, prev_df)
+
+    pd.testing.assert_frame_equal(top20.reset_index(drop=True), expected, check_dtype=False)